@@ -29,6 +29,9 @@ class DamengConfig(BaseModel):
     DEFAULT_MAX_RETRIES: int = 3
     DEFAULT_ALLOWED_SCHEMAS: List[str] = ["*"]
     DEFAULT_MAX_RESULT_ROWS: int = 1000
+    DEFAULT_POOL_SIZE: int = 25
+    DEFAULT_POOL_MIN_SIZE: int = 5
+    DEFAULT_POOL_IDLE_TIMEOUT: int = 300
     
     # 数据库连接参数 - 必须从环境变量获取，无默认值
     host: str = Field(..., description="数据库主机地址")
@@ -50,6 +53,11 @@ class DamengConfig(BaseModel):
     enable_query_log: bool = Field(False, description="是否启用查询日志")
     max_result_rows: int = Field(DEFAULT_MAX_RESULT_ROWS, description="最大返回行数")
     
+    # 连接池配置
+    pool_size: int = Field(DEFAULT_POOL_SIZE, description="连接池最大连接数")
+    pool_min_size: int = Field(DEFAULT_POOL_MIN_SIZE, description="连接池启动时预热的连接数")
+    pool_idle_timeout: int = Field(DEFAULT_POOL_IDLE_TIMEOUT, description="空闲超过该时间（秒）的连接在复用前先做健康检查")
+    
     @validator('security_mode', pre=True)
     def validate_security_mode(cls, v):
         """验证安全模式"""
@@ -67,6 +75,27 @@ class DamengConfig(BaseModel):
             raise ValueError("至少需要指定一个允许访问的模式")
         return v
     
+    @validator('pool_size')
+    def validate_pool_size(cls, v):
+        """验证连接池最大连接数（为0时所有请求都会等待连接超时）"""
+        if v < 1:
+            raise ValueError(f"连接池最大连接数必须大于0: {v}")
+        return v
+    
+    @validator('pool_min_size')
+    def validate_pool_min_size(cls, v):
+        """验证连接池预热连接数"""
+        if v < 0:
+            raise ValueError(f"连接池预热连接数不能为负数: {v}")
+        return v
+    
+    @validator('pool_idle_timeout')
+    def validate_pool_idle_timeout(cls, v):
+        """验证连接空闲超时时间"""
+        if v < 0:
+            raise ValueError(f"连接空闲超时时间不能为负数: {v}")
+        return v
+    
     def get_connection_string(self) -> str:
         """获取数据库连接字符串（达梦数据库格式）"""
         return (
@@ -135,7 +164,10 @@ class DamengConfig(BaseModel):
             "DAMENG_SECURITY_MODE": ("security_mode", str),
             "DAMENG_ALLOWED_SCHEMAS": ("allowed_schemas", lambda x: x.split(",")),
             "DAMENG_ENABLE_QUERY_LOG": ("enable_query_log", lambda x: x.lower() == "true"),
-            "DAMENG_MAX_RESULT_ROWS": ("max_result_rows", int)
+            "DAMENG_MAX_RESULT_ROWS": ("max_result_rows", int),
+            "DAMENG_POOL_SIZE": ("pool_size", int),
+            "DAMENG_POOL_MIN_SIZE": ("pool_min_size", int),
+            "DAMENG_POOL_IDLE_TIMEOUT": ("pool_idle_timeout", int)
         }
         
         for env_var, (field_name, type_converter) in optional_env_vars.items():
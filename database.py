@@ -7,18 +7,87 @@ Licensed under the MIT License.
 See LICENSE file in the project root for full license information.
 """
 import dmPython
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Sequence, Set
 import logging
-from contextlib import contextmanager
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from decimal import Decimal
+import functools
 import time
 import hashlib
+import queue
+import re
+import threading
 from config import get_config_instance, SecurityMode
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SELECT语句中禁止出现的危险子句（模块加载时预编译，合并为单次扫描）
+_DANGEROUS_IN_SELECT = re.compile(
+    r'\bDROP\s+TABLE\b'
+    r'|\bTRUNCATE\s+TABLE\b'
+    r'|\bDELETE\s+FROM\b'
+    r'|\bINSERT\s+INTO\b'
+    r'|\bUPDATE\s+\w+\s+SET\b'
+    r'|\bCREATE\s+TABLE\b'
+    r'|\bALTER\s+TABLE\b',
+    re.IGNORECASE
+)
+
+# 返回结果集的语句首关键字
+_READ_KEYWORDS = frozenset({'SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'EXPLAIN'})
+
+# 判断语句是否为查询：只匹配开头的首个关键字（与 SQLValidator 提取首关键字的规则一致）
+_READ_SQL_RE = re.compile(
+    r'[\s(]*(?:' + '|'.join(sorted(_READ_KEYWORDS)) + r')(?![A-Za-z0-9_])',
+    re.IGNORECASE
+)
+
+# 外层 ROWNUM 包装因内层查询列名重复而失败时的错误信息（列定义不明确/重复）
+_AMBIGUOUS_COLUMN_RE = re.compile(r'ambiguous|ORA-00918|不明确|重复', re.IGNORECASE)
+
+# 说明连接本身已不可用的错误类型（语句级错误不在其中）
+_CONNECTION_ERRORS = (dmPython.OperationalError, dmPython.InterfaceError)
+
+# SQL中已自带行数限制（或不能包装为子查询）的标志
+_ROW_LIMIT_RE = re.compile(r'\b(?:ROWNUM|LIMIT|TOP|FETCH\s+FIRST|FOR\s+UPDATE)\b', re.IGNORECASE)
+
+
+def _convert_value(value: Any) -> Any:
+    """转换 Decimal 为 float 或 str 以支持 JSON 序列化"""
+    if isinstance(value, Decimal):
+        # 对于 Decimal，转换为 float（如果精度允许）或 str
+        try:
+            return float(value)
+        except (OverflowError, ValueError):
+            return str(value)
+    return value
+
+
+def _cache_metadata(method):
+    """
+    元数据查询结果缓存装饰器，按（方法名, 参数）缓存到 metadata_cache
+    
+    只缓存正常返回的结果，查询出错时异常直接抛出、不写入缓存（出错后的降级处理应放在被装饰的方法之外）。
+    缓存的列表和字典由所有调用方共享，调用方不应修改返回的结果。
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._metadata_cache_enabled:
+            return method(self, *args, **kwargs)
+        
+        key = f"{method.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+        cached = self.metadata_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = method(self, *args, **kwargs)
+        self.metadata_cache.set(key, result)
+        return result
+    return wrapper
+
 
 class QueryCache:
     """查询缓存管理器"""
@@ -35,45 +104,52 @@ class QueryCache:
         self.max_size = max_size
         self.ttl = ttl
         self.access_times: Dict[str, float] = {}
+        # 元数据查询可能在多个线程中并发执行
+        self._lock = threading.Lock()
     
-    def _generate_key(self, sql: str, schema: str = None) -> str:
-        """生成缓存键"""
-        key_data = f"{sql}_{schema or ''}"
+    def _generate_key(self, sql: str, schema: str = None, params: Optional[tuple] = None) -> str:
+        """生成缓存键（参数化查询的参数也参与计算，避免不同参数命中同一条缓存）"""
+        key_data = f"{sql}_{schema or ''}_{params!r}"
         return hashlib.md5(key_data.encode('utf-8')).hexdigest()
     
-    def get(self, sql: str, schema: str = None) -> Optional[List[Dict[str, Any]]]:
+    def get(self, sql: str, schema: str = None, params: Optional[tuple] = None) -> Optional[List[Dict[str, Any]]]:
         """获取缓存结果"""
-        key = self._generate_key(sql, schema)
-        
-        if key not in self.cache:
-            return None
+        key = self._generate_key(sql, schema, params)
         
-        # 检查是否过期
-        if time.time() - self.cache[key]['timestamp'] > self.ttl:
-            self._remove(key)
-            return None
+        with self._lock:
+            if key not in self.cache:
+                return None
+            
+            # 检查是否过期
+            if time.time() - self.cache[key]['timestamp'] > self.ttl:
+                self._remove(key)
+                return None
+            
+            # 更新访问时间
+            self.access_times[key] = time.time()
+            data = self.cache[key]['data']
         
-        # 更新访问时间
-        self.access_times[key] = time.time()
-        logger.debug(f"缓存命中: {sql[:50]}...")
-        return self.cache[key]['data']
+        logger.debug("缓存命中: %.50s...", sql)
+        return data
     
-    def set(self, sql: str, data: List[Dict[str, Any]], schema: str = None):
+    def set(self, sql: str, data: List[Dict[str, Any]], schema: str = None, params: Optional[tuple] = None):
         """设置缓存结果"""
-        key = self._generate_key(sql, schema)
+        key = self._generate_key(sql, schema, params)
         
-        # 如果缓存已满，删除最旧的条目
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
+        with self._lock:
+            # 如果缓存已满，删除最旧的条目
+            if len(self.cache) >= self.max_size:
+                self._evict_oldest()
+            
+            self.cache[key] = {
+                'data': data,
+                'timestamp': time.time(),
+                'sql': sql,
+                'schema': schema
+            }
+            self.access_times[key] = time.time()
         
-        self.cache[key] = {
-            'data': data,
-            'timestamp': time.time(),
-            'sql': sql,
-            'schema': schema
-        }
-        self.access_times[key] = time.time()
-        logger.debug(f"缓存设置: {sql[:50]}...")
+        logger.debug("缓存设置: %.50s...", sql)
     
     def _remove(self, key: str):
         """删除缓存条目"""
@@ -92,18 +168,207 @@ class QueryCache:
     
     def clear(self):
         """清空缓存"""
-        self.cache.clear()
-        self.access_times.clear()
+        with self._lock:
+            self.cache.clear()
+            self.access_times.clear()
         logger.info("查询缓存已清空")
     
     def get_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息"""
-        return {
-            'cache_size': len(self.cache),
-            'max_size': self.max_size,
-            'ttl': self.ttl,
-            'entries': list(self.cache.keys())
-        }
+        with self._lock:
+            return {
+                'cache_size': len(self.cache),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'entries': list(self.cache.keys())
+            }
+
+
+class ConnectionPool:
+    """达梦数据库连接池（复用已建立的连接，避免每次查询重复握手和认证）"""
+    
+    PING_SQL = "SELECT 1 FROM DUAL"
+    
+    def __init__(self, connect_func, max_size: int = 25, min_size: int = 5,
+                 idle_timeout: int = 300, acquire_timeout: int = 30,
+                 statement_cache_size: int = 32):
+        """
+        初始化连接池
+        
+        Args:
+            connect_func: 创建新连接的函数
+            max_size: 同时打开的最大连接数，达到上限后取连接会阻塞等待
+            min_size: 预热时建立的连接数
+            idle_timeout: 空闲超过该时间（秒）的连接在复用前先做健康检查
+            acquire_timeout: 等待可用连接的最长时间（秒）
+            statement_cache_size: 每个连接缓存的语句游标数
+        """
+        self._connect = connect_func
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        # 每个借出的连接占用一个名额，空闲连接都来自归还，总连接数不会超过上限
+        self._slots = threading.BoundedSemaphore(max_size)
+        # LIFO 优先复用最近归还的连接，使多余连接自然老化
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_size)
+        self.statement_cache_size = statement_cache_size
+        # 连接 id -> {SQL: 游标}，按最近使用排序；连接关闭时一并清理
+        self._statements: Dict[int, OrderedDict] = {}
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._created = 0
+        self._reused = 0
+        self._ping_failures = 0
+    
+    def warm_up(self):
+        """预先建立 min_size 个连接放入池中，失败时仅记录日志"""
+        for _ in range(self.min_size - self._idle.qsize()):
+            try:
+                conn = self._new_connection()
+            except Exception as e:
+                logger.warning("连接池预热失败: %s", e)
+                break
+            self._idle.put_nowait((conn, time.monotonic()))
+    
+    def get(self):
+        """取出一个可用连接，池中没有空闲连接时新建，已达上限时等待归还"""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"获取数据库连接超时: 连接池已达上限 {self.max_size}")
+        
+        try:
+            conn = self._take_idle()
+            if conn is None:
+                conn = self._new_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        with self._lock:
+            self._in_use += 1
+        return conn
+    
+    def put(self, conn):
+        """归还连接"""
+        self._release()
+        try:
+            self._idle.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self._close(conn)
+        finally:
+            self._slots.release()
+    
+    def discard(self, conn):
+        """丢弃出错的连接"""
+        self._release()
+        self._close(conn)
+        self._slots.release()
+    
+    def close_all(self):
+        """关闭池中所有空闲连接"""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close(conn)
+    
+    def statement_cursor(self, conn, sql: str):
+        """
+        获取连接上执行指定SQL的缓存游标
+        
+        dmPython 没有独立的预编译语句对象，语句按游标预编译；同一游标再次执行相同SQL文本
+        时可复用已预编译的语句，只需绑定新参数。调用方必须持有该连接，且不能关闭返回的游标。
+        """
+        with self._lock:
+            statements = self._statements.setdefault(id(conn), OrderedDict())
+        
+        cur = statements.get(sql)
+        if cur is not None:
+            statements.move_to_end(sql)
+            return cur
+        
+        cur = conn.cursor()
+        statements[sql] = cur
+        if len(statements) > self.statement_cache_size:
+            _, oldest = statements.popitem(last=False)
+            self._close_cursor(oldest)
+        return cur
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """获取连接池统计信息"""
+        with self._lock:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'idle': self._idle.qsize(),
+                'in_use': self._in_use,
+                'created': self._created,
+                'reused': self._reused,
+                'ping_failures': self._ping_failures,
+                'idle_timeout': self.idle_timeout
+            }
+    
+    def _take_idle(self):
+        """取出一个健康的空闲连接，没有时返回 None"""
+        while True:
+            try:
+                conn, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            
+            if time.monotonic() - last_used <= self.idle_timeout or self._ping(conn):
+                with self._lock:
+                    self._reused += 1
+                return conn
+            
+            with self._lock:
+                self._ping_failures += 1
+            self._close(conn)
+    
+    def _new_connection(self):
+        """建立新连接并计数"""
+        conn = self._connect()
+        with self._lock:
+            self._created += 1
+        return conn
+    
+    def _release(self):
+        """借出连接计数减一"""
+        with self._lock:
+            self._in_use -= 1
+    
+    def _ping(self, conn) -> bool:
+        """检查连接是否仍然可用"""
+        try:
+            with conn.cursor() as cur:
+                cur.execute(self.PING_SQL)
+                cur.fetchall()
+            return True
+        except Exception as e:
+            logger.warning("连接健康检查失败，将重新建立连接: %s", e)
+            return False
+    
+    @staticmethod
+    def _close_cursor(cur):
+        """安全关闭游标"""
+        try:
+            cur.close()
+        except Exception as e:
+            logger.debug("关闭游标失败: %s", e)
+    
+    def _close(self, conn):
+        """安全关闭连接（同时释放该连接上缓存的语句游标）"""
+        with self._lock:
+            statements = self._statements.pop(id(conn), None)
+        for cur in (statements or {}).values():
+            self._close_cursor(cur)
+        
+        try:
+            conn.close()
+            logger.info("达梦数据库连接已关闭")
+        except Exception as e:
+            logger.warning("关闭达梦数据库连接失败: %s", e)
 
 
 class SQLValidator:
@@ -124,92 +389,116 @@ class SQLValidator:
         'DELETE', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 'GRANT', 'REVOKE'
     }
     
+    # 各安全模式允许的首关键字（类加载时预计算）
+    _READONLY_ALLOWED = frozenset(READONLY_OPERATIONS)
+    _LIMITED_ALLOWED = frozenset(READONLY_OPERATIONS | WRITE_OPERATIONS)
+    
+    # 按完整单词匹配的禁用关键字（避免 RECREATE_AT 之类的列名误判），单次扫描
+    _FORBIDDEN_IN_READONLY_RE = re.compile(
+        r'\b(?:' + '|'.join(sorted(WRITE_OPERATIONS | DANGEROUS_OPERATIONS)) + r')\b', re.IGNORECASE
+    )
+    _DANGEROUS_RE = re.compile(
+        r'\b(?:' + '|'.join(sorted(DANGEROUS_OPERATIONS)) + r')\b', re.IGNORECASE
+    )
+    
+    # 首关键字 -> 操作类别，单次字典查找完成分类
+    _FIRST_KW_TABLE = {
+        **dict.fromkeys(READONLY_OPERATIONS, 'readonly'),
+        **dict.fromkeys(WRITE_OPERATIONS, 'write'),
+        **dict.fromkeys(DANGEROUS_OPERATIONS, 'dangerous'),
+    }
+    
+    # 跳过前导空白和括号，只匹配第一个单词（其后不能紧跟字母、数字或下划线，如 SELECT_1 不算 SELECT）
+    _FIRST_KW_RE = re.compile(r'[\s(]*([A-Za-z]+)(?![A-Za-z0-9_])')
+    
+    # 安全模式 -> 验证方法名，签名统一为 (first_keyword, sql) -> bool
+    _MODE_VALIDATORS = {
+        SecurityMode.READONLY: '_validate_readonly',
+        SecurityMode.LIMITED_WRITE: '_validate_limited_write',
+        SecurityMode.FULL_ACCESS: '_validate_full_access',
+    }
+    
     @classmethod
-    def validate_sql(cls, sql: str, security_mode: SecurityMode) -> bool:
-        """验证SQL语句是否符合当前安全模式"""
-        sql_upper = sql.upper().strip()
-        
+    def get_validator(cls, security_mode: SecurityMode):
+        """获取安全模式对应的验证方法（安全模式不变时可只解析一次后重复调用）"""
+        return getattr(cls, cls._MODE_VALIDATORS.get(security_mode, '_reject_all'))
+    
+    @classmethod
+    def validate_sql(cls, sql: str, security_mode: SecurityMode, first_keyword: Optional[str] = None) -> bool:
+        """验证SQL语句是否符合当前安全模式（first_keyword可由调用方预先提取后传入）"""
         # 提取SQL的第一个关键字
-        first_keyword = cls._extract_first_keyword(sql_upper)
-        
-        if security_mode == SecurityMode.READONLY:
-            return cls._validate_readonly(first_keyword, sql_upper)
-        elif security_mode == SecurityMode.LIMITED_WRITE:
-            return cls._validate_limited_write(first_keyword, sql_upper)
-        elif security_mode == SecurityMode.FULL_ACCESS:
-            return True  # 完全访问模式允许所有操作
+        if first_keyword is None:
+            first_keyword = cls._extract_first_keyword(sql)
         
-        return False
+        return cls.get_validator(security_mode)(first_keyword, sql)
     
     @classmethod
-    def _extract_first_keyword(cls, sql_upper: str) -> str:
-        """提取SQL的第一个关键字"""
-        words = sql_upper.split()
-        return words[0] if words else ""
+    def _extract_first_keyword(cls, sql: str) -> str:
+        """提取SQL的第一个关键字（仅对该关键字做大写转换）"""
+        match = cls._FIRST_KW_RE.match(sql)
+        return match.group(1).upper() if match else ""
     
     @classmethod
-    def _validate_readonly(cls, first_keyword: str, sql_upper: str) -> bool:
+    def _validate_readonly(cls, first_keyword: str, sql: str) -> bool:
         """验证只读模式的SQL"""
-        if first_keyword not in cls.READONLY_OPERATIONS:
+        if first_keyword not in cls._READONLY_ALLOWED:
             return False
         
         # 对于SELECT查询，进行更精确的检查
         if first_keyword == 'SELECT':
             # 检查是否包含危险的SQL子句（而不是简单的关键字匹配）
-            dangerous_patterns = [
-                r'\bDROP\s+TABLE\b',
-                r'\bTRUNCATE\s+TABLE\b', 
-                r'\bDELETE\s+FROM\b',
-                r'\bINSERT\s+INTO\b',
-                r'\bUPDATE\s+\w+\s+SET\b',
-                r'\bCREATE\s+TABLE\b',
-                r'\bALTER\s+TABLE\b'
-            ]
-            
-            import re
-            for pattern in dangerous_patterns:
-                if re.search(pattern, sql_upper):
-                    return False
+            if _DANGEROUS_IN_SELECT.search(sql):
+                return False
         else:
-            # 对于其他只读操作，检查是否包含写入操作的关键子句
-            forbidden_in_readonly = cls.WRITE_OPERATIONS.union(cls.DANGEROUS_OPERATIONS)
-            for forbidden in forbidden_in_readonly:
-                if forbidden in sql_upper:
-                    return False
+            # 对于其他只读操作，检查是否包含写入操作的关键字
+            if cls._FORBIDDEN_IN_READONLY_RE.search(sql):
+                return False
         
         return True
     
     @classmethod
-    def _validate_limited_write(cls, first_keyword: str, sql_upper: str) -> bool:
+    def _validate_limited_write(cls, first_keyword: str, sql: str) -> bool:
         """验证限制写入模式的SQL"""
-        allowed_operations = cls.READONLY_OPERATIONS.union(cls.WRITE_OPERATIONS)
-        
-        if first_keyword not in allowed_operations:
+        if first_keyword not in cls._LIMITED_ALLOWED:
             return False
         
         # 检查是否包含危险操作
-        for dangerous in cls.DANGEROUS_OPERATIONS:
-            if dangerous in sql_upper:
-                return False
+        if cls._DANGEROUS_RE.search(sql):
+            return False
         
         return True
     
     @classmethod
-    def get_error_message(cls, sql: str, security_mode: SecurityMode) -> str:
+    def _validate_full_access(cls, first_keyword: str, sql: str) -> bool:
+        """完全访问模式允许所有操作"""
+        return True
+    
+    @classmethod
+    def _reject_all(cls, first_keyword: str, sql: str) -> bool:
+        """未知安全模式拒绝所有操作"""
+        return False
+    
+    @classmethod
+    def get_error_message(cls, sql: str, security_mode: SecurityMode, first_keyword: Optional[str] = None) -> str:
         """获取具体的错误信息"""
-        sql_upper = sql.upper().strip()
-        first_keyword = cls._extract_first_keyword(sql_upper)
+        if first_keyword is None:
+            first_keyword = cls._extract_first_keyword(sql)
+        category = cls._FIRST_KW_TABLE.get(first_keyword)
+        # 无法识别首关键字（如SQL以注释开头）时，提示信息显示SQL的第一个词
+        if not first_keyword:
+            words = sql.split()
+            first_keyword = words[0].upper() if words else ""
         
         if security_mode == SecurityMode.READONLY:
-            if first_keyword in cls.WRITE_OPERATIONS:
+            if category == 'write':
                 return f"只读模式下禁止写入操作: {first_keyword}"
-            elif first_keyword in cls.DANGEROUS_OPERATIONS:
+            elif category == 'dangerous':
                 return f"只读模式下禁止危险操作: {first_keyword}"
             else:
                 return f"只读模式下不支持的操作: {first_keyword}"
         
         elif security_mode == SecurityMode.LIMITED_WRITE:
-            if first_keyword in cls.DANGEROUS_OPERATIONS:
+            if category == 'dangerous':
                 return f"限制写入模式下禁止危险操作: {first_keyword}"
             else:
                 return f"限制写入模式下不支持的操作: {first_keyword}"
@@ -217,6 +506,11 @@ class SQLValidator:
         return "操作被安全策略禁止"
 
 
+def is_query_sql(sql: str) -> bool:
+    """判断SQL是否为返回结果集的查询语句（只检查首关键字，不对整条SQL做大写转换）"""
+    return _READ_SQL_RE.match(sql) is not None
+
+
 class DamengDatabase:
     """达梦数据库操作类"""
     
@@ -224,141 +518,267 @@ class DamengDatabase:
     SYSTEM_USERS = ('SYS', 'SYSTEM', 'SYSAUDITOR', 'CTXSYS')
     DEFAULT_AUTO_COMMIT = True
     DEFAULT_SCHEMA = 'SYSDBA'
+    METADATA_CACHE_MAX_SIZE = 512
+    METADATA_CACHE_TTL = 60
+    STATEMENT_CACHE_SIZE = 32
+    # 连接测试成功后，该时间（秒）内再次测试直接返回成功
+    HEALTH_CHECK_TTL = 5
     
     def __init__(self):
         self.config = get_config_instance()
         self.sql_validator = SQLValidator()
+        # 最近一次连接测试成功的时间（time.monotonic）
+        self._last_ok_ts: Optional[float] = None
+        # get_table_full_metadata 的合并查询是否可用（执行失败一次后改为逐项查询）
+        self._full_metadata_supported = True
+        # 自动发现模式下schema访问权限检查结果缓存
+        self._schema_allowed_cache: Dict[str, bool] = {}
+        # 安全模式在运行期间不变，初始化时解析一次验证方法
+        self._validate = self.sql_validator.get_validator(self.config.security_mode)
         # 初始化查询缓存
         self.query_cache = QueryCache(
             max_size=getattr(self.config, 'cache_max_size', 100),
             ttl=getattr(self.config, 'cache_ttl', 300)
         )
-        logger.info(f"达梦数据库服务初始化完成，安全模式: {self.config.security_mode.value}")
+        # 元数据（表、字段、索引、约束）缓存，会话内模式结构很少变化；
+        # 完全访问模式下可能执行DDL，不缓存以便立即看到结构变化
+        self.metadata_cache = QueryCache(
+            max_size=self.METADATA_CACHE_MAX_SIZE,
+            ttl=self.METADATA_CACHE_TTL
+        )
+        self._metadata_cache_enabled = not self.config.is_dangerous_operation_allowed()
+        # 初始化连接池
+        self.pool = ConnectionPool(
+            self._create_connection,
+            max_size=self.config.pool_size,
+            min_size=self.config.pool_min_size,
+            idle_timeout=self.config.pool_idle_timeout,
+            acquire_timeout=self.config.connect_timeout,
+            statement_cache_size=self.STATEMENT_CACHE_SIZE
+        )
+        logger.info("达梦数据库服务初始化完成，安全模式: %s", self.config.security_mode.value)
+    
+    def _create_connection(self):
+        """建立新的达梦数据库连接"""
+        conn = dmPython.connect(
+            user=self.config.username,
+            password=self.config.password,
+            server=self.config.host,
+            port=self.config.port,
+            autoCommit=self.DEFAULT_AUTO_COMMIT  # 达梦数据库使用自动提交模式避免语法问题
+        )
+        
+        # 达梦数据库连接成功后记录配置的数据库实例信息
+        if self.config.database:
+            logger.info("连接配置的数据库实例: %s", self.config.database)
+        
+        # 达梦数据库连接配置
+        if self.config.is_readonly_mode():
+            logger.info("已设置达梦数据库连接为只读模式")
+        
+        logger.info("成功连接到达梦数据库（%s模式）", self.config.security_mode.value)
+        return conn
     
     @contextmanager
-    def get_connection(self):
-        """获取数据库连接上下文管理器"""
-        conn = None
+    def acquire(self):
+        """获取数据库连接上下文管理器（从连接池取出，使用完毕后归还）"""
+        try:
+            conn = self.pool.get()
+        except (dmPython.Error, TimeoutError) as e:
+            logger.error("达梦数据库连接错误: %s", e)
+            raise
+        
+        # 连接以自动提交模式建立，取出和归还时都无需额外的 commit 往返
+        # 只有连接级错误或执行被中断（KeyboardInterrupt等）时连接状态不可信，丢弃不再放回连接池；
+        # SQL错误、权限不足等语句级错误不影响连接本身，照常归还
+        broken = True
         try:
-            conn = dmPython.connect(
-                user=self.config.username,
-                password=self.config.password,
-                server=self.config.host,
-                port=self.config.port,
-                autoCommit=self.DEFAULT_AUTO_COMMIT  # 达梦数据库使用自动提交模式避免语法问题
-            )
-            
-            # 达梦数据库连接成功后记录配置的数据库实例信息
-            if self.config.database:
-                logger.info(f"连接配置的数据库实例: {self.config.database}")
-            
-            # 达梦数据库连接配置
-            if self.config.is_readonly_mode():
-                logger.info("已设置达梦数据库连接为只读模式")
-            
-            logger.info(f"成功连接到达梦数据库（{self.config.security_mode.value}模式）")
             yield conn
-            
-        except dmPython.Error as e:
-            logger.error(f"达梦数据库连接错误: {e}")
+            broken = False
+        except Exception as e:
+            broken = isinstance(e, _CONNECTION_ERRORS)
             raise
         finally:
-            if conn:
-                conn.close()
-                logger.info("达梦数据库连接已关闭")
+            if broken:
+                self.pool.discard(conn)
+            else:
+                self.pool.put(conn)
+    
+    # 兼容原有调用方式
+    get_connection = acquire
     
-    def execute_query(self, sql: str, params: Optional[tuple] = None, use_cache: bool = True) -> List[Dict[str, Any]]:
-        """执行查询语句"""
+    def _limit_select(self, sql: str, max_rows: int) -> str:
+        """为SELECT语句包装ROWNUM限制，让数据库只返回所需的行数"""
+        if _ROW_LIMIT_RE.search(sql):
+            return sql
+        return f"SELECT * FROM (\n{sql.rstrip().rstrip(';')}\n) WHERE ROWNUM <= {int(max_rows)}"
+    
+    def execute_query(self, sql: str, params: Optional[tuple] = None, use_cache: bool = True,
+                      limit_rows: bool = True, lowercase_keys: bool = False,
+                      max_rows: Optional[int] = None, reuse_statement: bool = False) -> List[Dict[str, Any]]:
+        """
+        执行查询语句
+        
+        max_rows 可进一步收紧返回行数（不超过 max_result_rows），只需展示部分结果的调用方
+        可借此避免从数据库拉取用不到的行；此时最多返回 max_rows 行，是否还有更多记录由调用方判断
+        （如多请求一行）。
+        limit_rows=False 时不受 max_result_rows 限制，lowercase_keys=True 时结果字段名统一转为小写，
+        reuse_statement=True 时复用连接上缓存的语句游标（适合SQL文本固定、只有绑定参数变化的查询），
+        三者仅供内部元数据查询使用
+        """
+        # 只提取一次首关键字，供安全检查和结果类型判断复用
+        first_keyword = self.sql_validator._extract_first_keyword(sql)
+        is_read = first_keyword in _READ_KEYWORDS
+        
         # 安全检查：验证SQL是否符合当前安全模式
-        if not self.sql_validator.validate_sql(sql, self.config.security_mode):
-            error_msg = self.sql_validator.get_error_message(sql, self.config.security_mode)
+        if not self._validate(first_keyword, sql):
+            error_msg = self.sql_validator.get_error_message(sql, self.config.security_mode, first_keyword)
             raise ValueError(f"SQL操作被安全策略禁止: {error_msg}")
         
+        # 本次查询最多返回的行数；按 max_result_rows 限制时多取一行用于判断结果是否被截断
+        row_limit = self.config.max_result_rows
+        fetch_limit = row_limit + 1
+        if max_rows is not None and max_rows < row_limit:
+            # 调用方自行收紧的行数上限，截断由调用方处理，不多取也不告警
+            row_limit = fetch_limit = max_rows
+        # 行数上限或字段名大小写不同的结果不能共用同一条缓存
+        cache_params = (params, row_limit if limit_rows else None, lowercase_keys)
+        
         # 对于只读查询，尝试从缓存获取
-        if use_cache and sql.upper().strip().startswith(('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'EXPLAIN')):
-            cached_result = self.query_cache.get(sql)
+        if use_cache and is_read:
+            cached_result = self.query_cache.get(sql, params=cache_params)
             if cached_result is not None:
-                logger.debug(f"从缓存返回查询结果: {sql[:50]}...")
+                logger.debug("从缓存返回查询结果: %.50s...", sql)
                 return cached_result
         
         # 记录查询日志（如果启用）
         if self.config.enable_query_log:
-            logger.info(f"执行SQL ({self.config.security_mode.value}): {sql[:200]}...")
+            logger.info("执行SQL (%s): %.200s...", self.config.security_mode.value, sql)
+        
+        exec_sql = sql
+        if is_read and limit_rows and first_keyword == 'SELECT':
+            exec_sql = self._limit_select(sql, fetch_limit)
         
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
+            if reuse_statement:
+                # 缓存游标归连接池管理，使用后不关闭
+                cursor_ctx = nullcontext(self.pool.statement_cursor(conn, exec_sql))
+            else:
+                cursor_ctx = conn.cursor()
+            with cursor_ctx as cur:
                 try:
-                    cur.execute(sql, params)
-                    
+                    try:
+                        cur.execute(exec_sql, params)
+                    except dmPython.Error as e:
+                        if exec_sql is sql or not _AMBIGUOUS_COLUMN_RE.search(str(e)):
+                            raise
+                        # 内层查询存在重名列（如多表JOIN的 SELECT *）时外层包装会报错，
+                        # 只有这种情况改为执行原始SQL，拉取行数仍由 fetchmany 限制
+                        logger.debug("ROWNUM包装后执行失败，改为执行原始SQL: %s", e)
+                        cur.execute(sql, params)
+
                     # 对于查询操作，获取结果
-                    if sql.upper().strip().startswith(('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'EXPLAIN')):
-                        results = cur.fetchall()
+                    if is_read:
+                        if limit_rows:
+                            cur.arraysize = fetch_limit
+                            results = cur.fetchmany(fetch_limit)
+                        else:
+                            results = cur.fetchall()
                         
-                        # 获取列名
-                        columns = [desc[0] for desc in cur.description] if cur.description else []
+                        # 获取列名（每个结果集只计算一次）
+                        columns = tuple(desc[0] for desc in cur.description) if cur.description else ()
+                        if lowercase_keys:
+                            columns = tuple(column.lower() for column in columns)
                         
                         # 将结果转换为字典列表，处理 Decimal 类型
-                        result_dicts = []
-                        for row in results:
-                            # 转换 Decimal 为 float 或 str 以支持 JSON 序列化
-                            converted_row = []
-                            for value in row:
-                                if isinstance(value, Decimal):
-                                    # 对于 Decimal，转换为 float（如果精度允许）或 str
-                                    try:
-                                        converted_row.append(float(value))
-                                    except (OverflowError, ValueError):
-                                        converted_row.append(str(value))
-                                else:
-                                    converted_row.append(value)
-                            result_dicts.append(dict(zip(columns, converted_row)))
-                        
-                        # 递归处理嵌套的 Decimal 类型
-                        def deep_convert_decimals(obj):
-                            if isinstance(obj, dict):
-                                return {k: deep_convert_decimals(v) for k, v in obj.items()}
-                            elif isinstance(obj, list):
-                                return [deep_convert_decimals(item) for item in obj]
-                            elif isinstance(obj, Decimal):
-                                try:
-                                    return float(obj)
-                                except (OverflowError, ValueError):
-                                    return str(obj)
-                            else:
-                                return obj
-                        
-                        result_dicts = deep_convert_decimals(result_dicts)
+                        result_dicts = [dict(zip(columns, map(_convert_value, row))) for row in results]
                         
                         # 限制返回结果数量
-                        if len(result_dicts) > self.config.max_result_rows:
-                            logger.warning(f"查询结果超过限制({self.config.max_result_rows})，截断返回")
-                            result_dicts = result_dicts[:self.config.max_result_rows]
+                        if limit_rows and len(result_dicts) > row_limit:
+                            logger.warning("查询结果超过限制(%s)，截断返回", row_limit)
+                            result_dicts = result_dicts[:row_limit]
                         
-                        logger.info(f"查询执行成功，返回 {len(result_dicts)} 条记录")
+                        logger.info("查询执行成功，返回 %d 条记录", len(result_dicts))
                         
                         # 将查询结果缓存
                         if use_cache:
-                            self.query_cache.set(sql, result_dicts)
+                            self.query_cache.set(sql, result_dicts, params=cache_params)
                         
                         return result_dicts
                     else:
                         # 对于非查询操作（INSERT、UPDATE等），返回影响的行数（已自动提交）
                         affected_rows = cur.rowcount
-                        logger.info(f"操作执行成功，影响 {affected_rows} 行")
+                        logger.info("操作执行成功，影响 %s 行", affected_rows)
                         return [{"affected_rows": affected_rows, "status": "success"}]
                         
                 except dmPython.Error as e:
-                    logger.error(f"SQL执行失败: {e}")
+                    logger.error("SQL执行失败: %s", e)
                     raise
     
-    def execute_safe_query(self, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
-        """执行安全查询（强制只读，用于系统查询）"""
+    def execute_many(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        批量执行写入语句（批量写入的推荐方式）
+        
+        整批参数只做一次安全检查、占用一个连接，并通过 executemany 一次下发、在同一事务中
+        提交一次，避免调用方循环调用 execute_query 带来的逐行往返开销；任一行失败时整批回滚
+        
+        Args:
+            sql: 带参数占位符的 INSERT/UPDATE 等写入语句
+            rows: 参数序列，每个元素对应一行参数
+            
+        Returns:
+            影响的行数
+        """
+        first_keyword = self.sql_validator._extract_first_keyword(sql)
+        
+        # 安全检查：整批只验证一次
+        if not self._validate(first_keyword, sql):
+            error_msg = self.sql_validator.get_error_message(sql, self.config.security_mode, first_keyword)
+            raise ValueError(f"SQL操作被安全策略禁止: {error_msg}")
+        
+        if first_keyword in _READ_KEYWORDS:
+            raise ValueError("批量执行仅支持写入语句，查询请使用 execute_query")
+        
+        if not rows:
+            return 0
+        
+        if self.config.enable_query_log:
+            logger.info("批量执行SQL (%s, %d 组参数): %.200s...", self.config.security_mode.value, len(rows), sql)
+        
+        with self.get_connection() as conn:
+            # 整批在一个事务中执行：临时关闭自动提交，全部成功后提交一次，失败时整批回滚
+            conn.autoCommit = False
+            try:
+                with conn.cursor() as cur:
+                    try:
+                        cur.executemany(sql, rows)
+                        affected_rows = cur.rowcount
+                        conn.commit()
+                    except dmPython.Error as e:
+                        logger.error("批量SQL执行失败，整批回滚: %s", e)
+                        conn.rollback()
+                        raise
+            finally:
+                # 恢复自动提交后才能放回连接池；恢复失败时按连接错误处理，丢弃该连接
+                try:
+                    conn.autoCommit = self.DEFAULT_AUTO_COMMIT
+                except Exception as e:
+                    raise dmPython.InterfaceError(f"恢复自动提交模式失败: {e}") from e
+        
+        logger.info("批量操作执行成功，影响 %s 行", affected_rows)
+        return affected_rows
+    
+    def execute_safe_query(self, sql: str, params: Optional[tuple] = None,
+                           limit_rows: bool = True, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """执行安全查询（强制只读，用于系统查询，结果字段名统一为小写）"""
         # 强制验证为只读操作
         if not self.sql_validator.validate_sql(sql, SecurityMode.READONLY):
             raise ValueError("系统查询必须是只读操作")
         
-        return self.execute_query(sql, params)
+        return self.execute_query(sql, params, use_cache=use_cache, limit_rows=limit_rows,
+                                  lowercase_keys=True, reuse_statement=True)
     
+    @_cache_metadata
     def get_all_tables(self, schema: str = None) -> List[Dict[str, Any]]:
         """获取所有表信息（适配达梦数据库）"""
         if schema is None:
@@ -383,7 +803,7 @@ class DamengDatabase:
         WHERE OWNER = ? 
         ORDER BY TABLE_NAME
         """
-        return self.execute_safe_query(sql, (schema,))
+        return self.execute_safe_query(sql, (schema,), use_cache=False)
     
     def _is_schema_allowed(self, schema: str) -> bool:
         """检查schema是否被允许访问"""
@@ -393,6 +813,10 @@ class DamengDatabase:
         
         # 如果配置为自动发现schema
         if self.config.is_auto_discover_schemas():
+            # 已确认过的schema直接返回，避免重复查询
+            if schema in self._schema_allowed_cache:
+                return self._schema_allowed_cache[schema]
+            
             # 尝试查询该schema是否存在且用户有权限访问
             try:
                 test_sql = """
@@ -401,9 +825,13 @@ class DamengDatabase:
                 WHERE USERNAME = ?
                 """
                 result = self.execute_safe_query(test_sql, (schema,))
-                return len(result) > 0
             except Exception:
+                # 查询失败不缓存，下次重新检查
                 return False
+            
+            allowed = len(result) > 0
+            self._schema_allowed_cache[schema] = allowed
+            return allowed
         
         # 否则检查是否在明确允许的列表中
         return schema in self.config.allowed_schemas
@@ -417,6 +845,7 @@ class DamengDatabase:
         else:
             return str(self.config.allowed_schemas)
     
+    @_cache_metadata
     def get_available_schemas(self) -> List[Dict[str, Any]]:
         """获取用户有权限访问的所有schema（基于表所有者）"""
         sql = f"""
@@ -425,8 +854,9 @@ class DamengDatabase:
         WHERE OWNER NOT IN {self.SYSTEM_USERS}
         ORDER BY OWNER
         """
-        return self.execute_safe_query(sql)
+        return self.execute_safe_query(sql, use_cache=False)
 
+    @_cache_metadata
     def get_table_structure(self, table_name: str, schema: str = None) -> List[Dict[str, Any]]:
         """获取表结构信息（适配达梦数据库）"""
         if schema is None:
@@ -467,7 +897,7 @@ class DamengDatabase:
         WHERE c.TABLE_NAME = ?
         ORDER BY c.COLUMN_ID
         """
-        return self.execute_safe_query(sql, (table_name, table_name))
+        return self.execute_safe_query(sql, (table_name, table_name), use_cache=False)
 
     def get_table_comment(self, table_name: str, schema: str = None) -> str:
         """获取表的注释（优先从 ALL_TAB_COMMENTS 读取）"""
@@ -478,18 +908,23 @@ class DamengDatabase:
             allowed_schemas = self._get_allowed_schemas_display()
             raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
         try:
-            sql = """
-            SELECT COMMENTS
-            FROM USER_TAB_COMMENTS
-            WHERE TABLE_NAME = ?
-            """
-            result = self.execute_safe_query(sql, (table_name,))
-            if result and (result[0].get('COMMENTS') or result[0].get('comments')):
-                return result[0].get('COMMENTS') or result[0].get('comments')
-            return ""
+            return self._query_table_comment(table_name)
         except Exception:
             return ""
     
+    @_cache_metadata
+    def _query_table_comment(self, table_name: str) -> str:
+        """查询表注释（查询失败时抛出异常，不写入缓存）"""
+        sql = """
+        SELECT COMMENTS
+        FROM USER_TAB_COMMENTS
+        WHERE TABLE_NAME = ?
+        """
+        result = self.execute_safe_query(sql, (table_name,), use_cache=False)
+        if result:
+            return result[0].get('comments') or ""
+        return ""
+    
     def get_table_indexes(self, table_name: str, schema: str = None) -> List[Dict[str, Any]]:
         """获取表索引信息（适配达梦数据库）"""
         if schema is None:
@@ -499,23 +934,298 @@ class DamengDatabase:
             allowed_schemas = self._get_allowed_schemas_display()
             raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
         
+        try:
+            return self._query_table_indexes(table_name)
+        except Exception as e:
+            logger.warning("获取索引信息失败: %s", e)
+            return []  # 返回空列表而不是抛出异常
+    
+    @_cache_metadata
+    def _query_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
+        """查询表索引（查询失败时抛出异常，不写入缓存）"""
+        sql = """
+        SELECT 
+            INDEX_NAME as indexname,
+            'CREATE INDEX ' || INDEX_NAME || ' ON ' || TABLE_NAME as indexdef,
+            CASE WHEN UNIQUENESS = 'UNIQUE' THEN 'YES' ELSE 'NO' END as is_unique
+        FROM USER_INDEXES 
+        WHERE TABLE_NAME = ?
+        ORDER BY INDEX_NAME
+        """
+        return self.execute_safe_query(sql, (table_name,), use_cache=False)
+    
+    def get_table_constraints(self, table_name: str, schema: str = None) -> List[Dict[str, Any]]:
+        """获取表约束信息（适配达梦数据库）"""
+        if schema is None:
+            schema = self.DEFAULT_SCHEMA
+            
+        if not self._is_schema_allowed(schema):
+            allowed_schemas = self._get_allowed_schemas_display()
+            raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
+        
+        try:
+            return self._query_table_constraints(table_name)
+        except Exception as e:
+            logger.warning("获取约束信息失败: %s", e)
+            return []  # 返回空列表而不是抛出异常
+    
+    @_cache_metadata
+    def _query_table_constraints(self, table_name: str) -> List[Dict[str, Any]]:
+        """查询表约束（查询失败时抛出异常，不写入缓存）"""
+        sql = """
+        SELECT 
+            cons.CONSTRAINT_NAME as constraint_name,
+            cons.CONSTRAINT_TYPE as constraint_type,
+            cc.COLUMN_NAME as column_name,
+            CASE 
+                WHEN cons.CONSTRAINT_TYPE = 'R' THEN
+                    ref_cons.OWNER||'.'||ref_cons.TABLE_NAME||'.'||ref_cc.COLUMN_NAME
+                ELSE NULL
+            END as foreign_key_references
+        FROM USER_CONSTRAINTS cons
+        LEFT JOIN USER_CONS_COLUMNS cc ON cons.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
+        LEFT JOIN USER_CONSTRAINTS ref_cons ON cons.R_CONSTRAINT_NAME = ref_cons.CONSTRAINT_NAME
+        LEFT JOIN USER_CONS_COLUMNS ref_cc ON ref_cons.CONSTRAINT_NAME = ref_cc.CONSTRAINT_NAME
+        WHERE cons.TABLE_NAME = ?
+        ORDER BY cons.CONSTRAINT_TYPE, cons.CONSTRAINT_NAME
+        """
+        return self.execute_safe_query(sql, (table_name,), use_cache=False)
+    
+    # get_table_full_metadata 各类结果行保留的字段（SQL别名 -> 结果字段名）
+    _FULL_METADATA_FIELDS = {
+        'C': (('column_name', 'column_name'), ('data_type', 'data_type'),
+              ('character_maximum_length', 'character_maximum_length'),
+              ('numeric_precision', 'numeric_precision'), ('numeric_scale', 'numeric_scale'),
+              ('is_nullable', 'is_nullable'), ('column_default', 'column_default'),
+              ('ordinal_position', 'ordinal_position'), ('is_primary_key', 'is_primary_key'),
+              ('column_comment', 'column_comment')),
+        'I': (('indexname', 'indexname'), ('indexdef', 'indexdef'), ('is_unique', 'is_unique')),
+        'K': (('constraint_name', 'constraint_name'), ('constraint_type', 'constraint_type'),
+              ('constraint_column', 'column_name'), ('foreign_key_references', 'foreign_key_references')),
+    }
+    
+    def get_table_full_metadata(self, table_name: str, schema: str = None) -> Optional[tuple]:
+        """
+        一次查询获取表结构、索引、约束和表注释
+        
+        四类结果通过 UNION ALL 合并为一个结果集（kind 列区分：C 字段、I 索引、K 约束、T 表注释），
+        只需一次数据库往返；返回值与分别调用 get_table_structure、get_table_indexes、
+        get_table_constraints、get_table_comment 的结果一致。合并查询因语句不被支持而失败后
+        （如数据库不支持某些列参与集合运算）记录下来，之后不再重复尝试。
+        
+        Returns:
+            (structure, indexes, constraints, table_comment)；合并查询不可用或本次执行失败时返回 None，
+            由调用方分别调用上述四个方法（可并发执行）
+        """
+        if schema is None:
+            schema = self.DEFAULT_SCHEMA
+            
+        if not self._is_schema_allowed(schema):
+            allowed_schemas = self._get_allowed_schemas_display()
+            raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
+        
+        if self._full_metadata_supported:
+            try:
+                return self._query_table_full_metadata(table_name)
+            except Exception as e:
+                # 合并查询失败时由调用方退回逐项查询（与合并前的行为一致）
+                logger.warning("合并查询表元数据失败，改为逐项查询: %s", e)
+                # 只有SQL本身不被支持（语句级错误）时才不再尝试；网络中断等连接级错误下次仍使用合并查询
+                if isinstance(e, dmPython.Error) and not isinstance(e, _CONNECTION_ERRORS):
+                    self._full_metadata_supported = False
+        
+        return None
+    
+    @_cache_metadata
+    def _query_table_full_metadata(self, table_name: str) -> tuple:
+        """执行合并查询获取表元数据（查询失败时抛出异常，不写入缓存）"""
+        # 第一个分支决定各列类型，其余类型的列用带类型的 NULL 占位
+        sql = """
+        SELECT 
+            'C' as kind,
+            c.COLUMN_NAME as column_name,
+            c.DATA_TYPE as data_type,
+            c.DATA_LENGTH as character_maximum_length,
+            c.DATA_PRECISION as numeric_precision,
+            c.DATA_SCALE as numeric_scale,
+            CASE WHEN c.NULLABLE = 'Y' THEN 'YES' ELSE 'NO' END as is_nullable,
+            c.DATA_DEFAULT as column_default,
+            c.COLUMN_ID as ordinal_position,
+            CASE 
+                WHEN pk.COLUMN_NAME IS NOT NULL THEN 'YES'
+                ELSE 'NO'
+            END as is_primary_key,
+            com.COMMENTS as column_comment,
+            CAST(NULL AS VARCHAR(128)) as indexname,
+            CAST(NULL AS VARCHAR(1024)) as indexdef,
+            CAST(NULL AS VARCHAR(3)) as is_unique,
+            CAST(NULL AS VARCHAR(128)) as constraint_name,
+            CAST(NULL AS VARCHAR(128)) as constraint_type,
+            CAST(NULL AS VARCHAR(128)) as constraint_column,
+            CAST(NULL AS VARCHAR(1024)) as foreign_key_references,
+            CAST(NULL AS VARCHAR(4000)) as table_comment
+        FROM USER_TAB_COLUMNS c
+        LEFT JOIN USER_COL_COMMENTS com 
+            ON com.TABLE_NAME = c.TABLE_NAME 
+            AND com.COLUMN_NAME = c.COLUMN_NAME
+        LEFT JOIN (
+            SELECT cc.COLUMN_NAME
+            FROM USER_CONSTRAINTS cons
+            INNER JOIN USER_CONS_COLUMNS cc ON cons.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
+            WHERE cons.CONSTRAINT_TYPE = 'P'
+                AND cons.TABLE_NAME = ?
+        ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
+        WHERE c.TABLE_NAME = ?
+        UNION ALL
+        SELECT 
+            'I', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+            INDEX_NAME,
+            'CREATE INDEX ' || INDEX_NAME || ' ON ' || TABLE_NAME,
+            CASE WHEN UNIQUENESS = 'UNIQUE' THEN 'YES' ELSE 'NO' END,
+            NULL, NULL, NULL, NULL, NULL
+        FROM USER_INDEXES 
+        WHERE TABLE_NAME = ?
+        UNION ALL
+        SELECT 
+            'K', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+            NULL, NULL, NULL,
+            cons.CONSTRAINT_NAME,
+            cons.CONSTRAINT_TYPE,
+            cc.COLUMN_NAME,
+            CASE 
+                WHEN cons.CONSTRAINT_TYPE = 'R' THEN
+                    ref_cons.OWNER||'.'||ref_cons.TABLE_NAME||'.'||ref_cc.COLUMN_NAME
+                ELSE NULL
+            END,
+            NULL
+        FROM USER_CONSTRAINTS cons
+        LEFT JOIN USER_CONS_COLUMNS cc ON cons.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
+        LEFT JOIN USER_CONSTRAINTS ref_cons ON cons.R_CONSTRAINT_NAME = ref_cons.CONSTRAINT_NAME
+        LEFT JOIN USER_CONS_COLUMNS ref_cc ON ref_cons.CONSTRAINT_NAME = ref_cc.CONSTRAINT_NAME
+        WHERE cons.TABLE_NAME = ?
+        UNION ALL
+        SELECT 
+            'T', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+            NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+            COMMENTS
+        FROM USER_TAB_COMMENTS
+        WHERE TABLE_NAME = ?
+        ORDER BY kind, ordinal_position, indexname, constraint_type, constraint_name
+        """
+        rows = self.execute_safe_query(sql, (table_name,) * 5, limit_rows=False, use_cache=False)
+        
+        grouped: Dict[str, List[Dict[str, Any]]] = {'C': [], 'I': [], 'K': []}
+        table_comment = ""
+        for row in rows:
+            kind = row['kind']
+            if kind == 'T':
+                table_comment = row['table_comment'] or ""
+            else:
+                grouped[kind].append({key: row[alias] for alias, key in self._FULL_METADATA_FIELDS[kind]})
+        
+        return grouped['C'], grouped['I'], grouped['K'], table_comment
+    
+    def _group_by_table(self, rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """按表名分组查询结果（移除分组用的表名字段，保持与单表查询结果一致）"""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            row = dict(row)
+            table_name = row.pop('table_name', None)
+            grouped.setdefault(table_name, []).append(row)
+        return grouped
+    
+    @_cache_metadata
+    def _query_grouped_by_table(self, sql: str) -> Dict[str, List[Dict[str, Any]]]:
+        """执行模式级目录查询并按表名分组（与单表元数据共用 metadata_cache，查询失败时抛出异常，不写入缓存）"""
+        return self._group_by_table(self.execute_safe_query(sql, limit_rows=False, use_cache=False))
+    
+    def get_all_structures(self, schema: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """一次查询获取模式下所有表的结构信息，按表名分组"""
+        if schema is None:
+            schema = self.DEFAULT_SCHEMA
+            
+        if not self._is_schema_allowed(schema):
+            allowed_schemas = self._get_allowed_schemas_display()
+            raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
+        
+        sql = """
+        SELECT 
+            c.TABLE_NAME as table_name,
+            c.COLUMN_NAME as column_name,
+            c.DATA_TYPE as data_type,
+            c.DATA_LENGTH as character_maximum_length,
+            c.DATA_PRECISION as numeric_precision,
+            c.DATA_SCALE as numeric_scale,
+            CASE WHEN c.NULLABLE = 'Y' THEN 'YES' ELSE 'NO' END as is_nullable,
+            c.DATA_DEFAULT as column_default,
+            c.COLUMN_ID as ordinal_position,
+            CASE 
+                WHEN pk.COLUMN_NAME IS NOT NULL THEN 'YES'
+                ELSE 'NO'
+            END as is_primary_key,
+            com.COMMENTS as column_comment
+        FROM USER_TAB_COLUMNS c
+        LEFT JOIN USER_COL_COMMENTS com 
+            ON com.TABLE_NAME = c.TABLE_NAME 
+            AND com.COLUMN_NAME = c.COLUMN_NAME
+        LEFT JOIN (
+            SELECT cons.TABLE_NAME, cc.COLUMN_NAME
+            FROM USER_CONSTRAINTS cons
+            INNER JOIN USER_CONS_COLUMNS cc ON cons.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
+            WHERE cons.CONSTRAINT_TYPE = 'P'
+        ) pk ON c.TABLE_NAME = pk.TABLE_NAME AND c.COLUMN_NAME = pk.COLUMN_NAME
+        ORDER BY c.TABLE_NAME, c.COLUMN_ID
+        """
+        return self._query_grouped_by_table(sql)
+    
+    def get_all_table_comments(self, schema: str = None) -> Dict[str, str]:
+        """一次查询获取模式下所有表的注释"""
+        if schema is None:
+            schema = self.DEFAULT_SCHEMA
+            
+        if not self._is_schema_allowed(schema):
+            allowed_schemas = self._get_allowed_schemas_display()
+            raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
+        
+        try:
+            sql = """
+            SELECT TABLE_NAME, COMMENTS
+            FROM USER_TAB_COMMENTS
+            """
+            return {
+                table_name: rows[0].get('comments') or ""
+                for table_name, rows in self._query_grouped_by_table(sql).items()
+            }
+        except Exception as e:
+            logger.warning("获取表注释失败: %s", e)
+            return {}
+    
+    def get_all_indexes(self, schema: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """一次查询获取模式下所有表的索引信息，按表名分组"""
+        if schema is None:
+            schema = self.DEFAULT_SCHEMA
+            
+        if not self._is_schema_allowed(schema):
+            allowed_schemas = self._get_allowed_schemas_display()
+            raise ValueError(f"不允许访问模式: {schema}，允许的模式: {allowed_schemas}")
+        
         try:
             sql = """
             SELECT 
+                TABLE_NAME as table_name,
                 INDEX_NAME as indexname,
                 'CREATE INDEX ' || INDEX_NAME || ' ON ' || TABLE_NAME as indexdef,
                 CASE WHEN UNIQUENESS = 'UNIQUE' THEN 'YES' ELSE 'NO' END as is_unique
             FROM USER_INDEXES 
-            WHERE TABLE_NAME = ?
-            ORDER BY INDEX_NAME
+            ORDER BY TABLE_NAME, INDEX_NAME
             """
-            return self.execute_safe_query(sql, (table_name,))
+            return self._query_grouped_by_table(sql)
         except Exception as e:
-            logger.warning(f"获取索引信息失败: {e}")
-            return []  # 返回空列表而不是抛出异常
+            logger.warning("获取索引信息失败: %s", e)
+            return {}
     
-    def get_table_constraints(self, table_name: str, schema: str = None) -> List[Dict[str, Any]]:
-        """获取表约束信息（适配达梦数据库）"""
+    def get_all_constraints(self, schema: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """一次查询获取模式下所有表的约束信息，按表名分组"""
         if schema is None:
             schema = self.DEFAULT_SCHEMA
             
@@ -526,6 +1236,7 @@ class DamengDatabase:
         try:
             sql = """
             SELECT 
+                cons.TABLE_NAME as table_name,
                 cons.CONSTRAINT_NAME as constraint_name,
                 cons.CONSTRAINT_TYPE as constraint_type,
                 cc.COLUMN_NAME as column_name,
@@ -538,27 +1249,28 @@ class DamengDatabase:
             LEFT JOIN USER_CONS_COLUMNS cc ON cons.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
             LEFT JOIN USER_CONSTRAINTS ref_cons ON cons.R_CONSTRAINT_NAME = ref_cons.CONSTRAINT_NAME
             LEFT JOIN USER_CONS_COLUMNS ref_cc ON ref_cons.CONSTRAINT_NAME = ref_cc.CONSTRAINT_NAME
-            WHERE cons.TABLE_NAME = ?
-            ORDER BY cons.CONSTRAINT_TYPE, cons.CONSTRAINT_NAME
+            ORDER BY cons.TABLE_NAME, cons.CONSTRAINT_TYPE, cons.CONSTRAINT_NAME
             """
-            return self.execute_safe_query(sql, (table_name,))
+            return self._query_grouped_by_table(sql)
         except Exception as e:
-            logger.warning(f"获取约束信息失败: {e}")
-            return []  # 返回空列表而不是抛出异常
+            logger.warning("获取约束信息失败: %s", e)
+            return {}
     
     def test_connection(self) -> bool:
-        """测试数据库连接"""
+        """测试数据库连接（距上次成功不足 HEALTH_CHECK_TTL 秒时直接返回成功）"""
+        if self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < self.HEALTH_CHECK_TTL:
+            return True
+        
         try:
-            result = self.execute_safe_query("SELECT 1 as test_connection FROM DUAL")
-            if len(result) > 0:
-                # 达梦数据库字段名可能是大写，尝试两种格式
-                first_row = result[0]
-                test_value = first_row.get('test_connection') or first_row.get('TEST_CONNECTION')
-                return test_value == 1
-            return False
+            # 连接测试必须真正访问数据库，不使用查询缓存
+            result = self.execute_safe_query("SELECT 1 as test_connection FROM DUAL", use_cache=False)
+            ok = len(result) > 0 and result[0].get('test_connection') == 1
         except Exception as e:
-            logger.error(f"连接测试失败: {e}")
-            return False
+            logger.error("连接测试失败: %s", e)
+            ok = False
+        
+        self._last_ok_ts = time.monotonic() if ok else None
+        return ok
     
     def get_table_statistics(self, table_name: str, schema: str = None) -> Dict[str, Any]:
         """获取表的统计信息"""
@@ -591,9 +1303,9 @@ class DamengDatabase:
             try:
                 row_count_sql = f"SELECT COUNT(*) as row_count FROM {schema}.{table_name}"
                 row_count_result = self.execute_safe_query(row_count_sql)
-                row_count = row_count_result[0].get('row_count') or row_count_result[0].get('ROW_COUNT', 0)
+                row_count = row_count_result[0].get('row_count') or 0
             except Exception as e:
-                logger.warning(f"获取表行数失败: {e}")
+                logger.warning("获取表行数失败: %s", e)
                 row_count = 0
             
             # 获取字段数量
@@ -604,9 +1316,9 @@ class DamengDatabase:
                 WHERE TABLE_NAME = ? AND OWNER = ?
                 """
                 column_count_result = self.execute_safe_query(column_count_sql, (table_name, schema))
-                column_count = column_count_result[0].get('column_count') or column_count_result[0].get('COLUMN_COUNT', 0)
+                column_count = column_count_result[0].get('column_count') or 0
             except Exception as e:
-                logger.warning(f"获取字段数量失败: {e}")
+                logger.warning("获取字段数量失败: %s", e)
                 column_count = 0
             
             # 获取索引数量
@@ -617,9 +1329,9 @@ class DamengDatabase:
                 WHERE TABLE_NAME = ? AND OWNER = ?
                 """
                 index_count_result = self.execute_safe_query(index_count_sql, (table_name, schema))
-                index_count = index_count_result[0].get('index_count') or index_count_result[0].get('INDEX_COUNT', 0)
+                index_count = index_count_result[0].get('index_count') or 0
             except Exception as e:
-                logger.warning(f"获取索引数量失败: {e}")
+                logger.warning("获取索引数量失败: %s", e)
                 index_count = 0
             
             # 获取约束数量
@@ -630,9 +1342,9 @@ class DamengDatabase:
                 WHERE TABLE_NAME = ? AND OWNER = ?
                 """
                 constraint_count_result = self.execute_safe_query(constraint_count_sql, (table_name, schema))
-                constraint_count = constraint_count_result[0].get('constraint_count') or constraint_count_result[0].get('CONSTRAINT_COUNT', 0)
+                constraint_count = constraint_count_result[0].get('constraint_count') or 0
             except Exception as e:
-                logger.warning(f"获取约束数量失败: {e}")
+                logger.warning("获取约束数量失败: %s", e)
                 constraint_count = 0
             
             # 获取表的大小信息（如果可用）
@@ -649,13 +1361,13 @@ class DamengDatabase:
                 size_info_result = self.execute_safe_query(size_info_sql, (table_name, schema))
                 if size_info_result:
                     size_info = size_info_result[0]
-                    total_rows_from_stats = size_info.get('TOTAL_ROWS') or size_info.get('total_rows')
-                    last_stat_date = size_info.get('LAST_STAT_DT') or size_info.get('last_stat_dt')
+                    total_rows_from_stats = size_info.get('total_rows')
+                    last_stat_date = size_info.get('last_stat_dt')
                 else:
                     total_rows_from_stats = None
                     last_stat_date = None
             except Exception as e:
-                logger.warning(f"获取表大小信息失败: {e}")
+                logger.warning("获取表大小信息失败: %s", e)
                 total_rows_from_stats = None
                 last_stat_date = None
             
@@ -667,9 +1379,9 @@ class DamengDatabase:
                 "column_count": column_count,
                 "index_count": index_count,
                 "constraint_count": constraint_count,
-                "tablespace_name": table_info.get('TABLESPACE_NAME') or table_info.get('tablespace_name'),
-                "status": table_info.get('STATUS') or table_info.get('status'),
-                "last_analyzed": table_info.get('LAST_ANALYZED') or table_info.get('last_analyzed'),
+                "tablespace_name": table_info.get('tablespace_name'),
+                "status": table_info.get('status'),
+                "last_analyzed": table_info.get('last_analyzed'),
                 "total_rows_from_stats": total_rows_from_stats,
                 "last_stat_date": last_stat_date
             }
@@ -677,7 +1389,7 @@ class DamengDatabase:
             return statistics
             
         except Exception as e:
-            logger.error(f"获取表统计信息失败: {e}")
+            logger.error("获取表统计信息失败: %s", e)
             return {}
     
     def get_security_info(self) -> Dict[str, Any]:
@@ -689,7 +1401,8 @@ class DamengDatabase:
             "write_allowed": self.config.is_write_allowed(),
             "dangerous_operations_allowed": self.config.is_dangerous_operation_allowed(),
             "max_result_rows": self.config.max_result_rows,
-            "query_log_enabled": self.config.enable_query_log
+            "query_log_enabled": self.config.enable_query_log,
+            "pool_stats": self.pool.get_stats()
         }
     
     def get_cache_info(self) -> Dict[str, Any]:
@@ -699,8 +1412,15 @@ class DamengDatabase:
     def clear_cache(self):
         """清空查询缓存"""
         self.query_cache.clear()
+        self.invalidate_schema_cache()
         logger.info("查询缓存已清空")
     
+    def invalidate_schema_cache(self):
+        """清空元数据缓存（执行DDL后调用，使表结构变化立即可见）"""
+        self.metadata_cache.clear()
+        self._schema_allowed_cache.clear()
+        logger.info("元数据缓存已清空")
+    
     def get_table_relationships(self, schema: str = None) -> List[Dict[str, Any]]:
         """获取表间关系信息"""
         if schema is None:
@@ -735,11 +1455,11 @@ class DamengDatabase:
         """
         
         try:
-            results = self.execute_query(sql, use_cache=True)
-            logger.info(f"获取到 {len(results)} 个表关系")
+            results = self.execute_query(sql, use_cache=True, lowercase_keys=True)
+            logger.info("获取到 %d 个表关系", len(results))
             return results
         except Exception as e:
-            logger.error(f"获取表关系失败: {e}")
+            logger.error("获取表关系失败: %s", e)
             return []
 
 
@@ -10,9 +10,9 @@ See LICENSE file in the project root for full license information.
 """
 
 import asyncio
-import json
 import sys
 import os
+import uuid
 from datetime import datetime
 from typing import Any, Sequence
 import logging
@@ -30,8 +30,13 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
-from database import get_db_instance
-from document_generator import doc_generator
+try:
+    import uvloop
+except ImportError:  # 未安装uvloop（如Windows）时使用默认事件循环
+    uvloop = None
+
+from database import get_db_instance, is_query_sql
+from document_generator import doc_generator, dumps_json
 from config import get_config_instance
 
 # 配置日志
@@ -39,21 +44,22 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 def normalize_data(data_list):
-    """标准化数据，将大写字段名转换为小写（保持原字段名作为备份）"""
-    normalized = []
-    for item in data_list:
-        normalized_item = {}
-        for key, value in item.items():
-            # 保留原字段名
-            normalized_item[key] = value
-            # 添加小写字段名
-            normalized_item[key.lower()] = value
-        normalized.append(normalized_item)
-    return normalized
+    """
+    标准化数据，将字段名统一转换为小写
+    
+    同一结果集的字段名大小写一致，只检查第一行的第一个字段：已是小写时原样返回（不复制）
+    """
+    if not data_list or not data_list[0]:
+        return data_list
+    
+    sample = next(iter(data_list[0]))
+    if sample.islower():
+        return data_list
+    return [{key.lower(): value for key, value in item.items()} for item in data_list]
 
 def create_error_response(error_msg: str, error_type: str = "error") -> list[TextContent]:
     """创建统一的错误响应"""
-    logger.error(f"{error_type}: {error_msg}")
+    logger.error("%s: %s", error_type, error_msg)
     return [TextContent(
         type="text",
         text=f"❌ {error_type.upper()}: {error_msg}"
@@ -61,231 +67,283 @@ def create_error_response(error_msg: str, error_type: str = "error") -> list[Tex
 
 def create_success_response(success_msg: str) -> list[TextContent]:
     """创建统一的成功响应"""
-    logger.info(f"Success: {success_msg}")
+    logger.info("Success: %s", success_msg)
     return [TextContent(
         type="text",
         text=f"✅ {success_msg}"
     )]
 
+async def fetch_table_metadata(db, table_name: str, schema: str):
+    """
+    获取表结构、索引、约束和表注释（在线程池中执行以免阻塞事件循环）
+    
+    优先使用一次合并查询；合并查询不可用时四项元数据在线程池中并发逐项查询
+    """
+    metadata = await asyncio.to_thread(db.get_table_full_metadata, table_name, schema)
+    if metadata is not None:
+        return metadata
+    
+    return await asyncio.gather(
+        asyncio.to_thread(db.get_table_structure, table_name, schema),
+        asyncio.to_thread(db.get_table_indexes, table_name, schema),
+        asyncio.to_thread(db.get_table_constraints, table_name, schema),
+        asyncio.to_thread(db.get_table_comment, table_name, schema)
+    )
+
+def _generate_json_doc(table_name, structure, indexes, constraints, schema, table_comment):
+    """JSON文档整体序列化，作为单个片段返回"""
+    return (doc_generator.generate_json_structure(table_name, structure, indexes, constraints, schema, table_comment),)
+
+def _generate_sql_doc(table_name, structure, indexes, constraints, schema, table_comment):
+    """建表SQL只需要字段结构和表注释，作为单个片段返回"""
+    return (doc_generator.generate_sql_create_statement(table_name, structure, table_comment),)
+
+# 表文档格式 -> (生成函数, 文件扩展名)，生成函数参数统一为
+# (table_name, structure, indexes, constraints, schema, table_comment)，返回文档片段的可迭代对象
+TABLE_DOC_FORMATS = {
+    "markdown": (doc_generator.iter_table_structure_doc, ".md"),
+    "json": (_generate_json_doc, ".json"),
+    "sql": (_generate_sql_doc, ".sql"),
+}
+
+# 文档预览的最大字符数
+DOC_PREVIEW_CHARS = 1000
+
+# 文档文件写缓冲区大小：文档分成很多小片段写入，较大的缓冲区可减少写文件系统调用次数
+DOC_WRITE_BUFFER_SIZE = 64 * 1024
+
+# execute_query 工具最多展示的查询结果行数
+QUERY_PREVIEW_ROWS = 100
+
+# MCP服务所在目录，生成的文档保存在其下的docs目录
+SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _docs_dir() -> str:
+    """获取docs目录路径（目录不存在时创建，运行期间被删除也能恢复）"""
+    docs_dir = os.path.join(SERVICE_DIR, "docs")
+    os.makedirs(docs_dir, exist_ok=True)
+    return docs_dir
+
+def _write_doc(file_path: str, chunks) -> str:
+    """
+    逐段写入文档文件，返回文档开头部分作为预览（在线程中执行，避免阻塞事件循环）
+    
+    只保留预览所需的前 DOC_PREVIEW_CHARS 个字符，不在内存中拼出完整文档。
+    先写入同目录下的临时文件，全部写完后再替换为目标文件，生成或写入中途出错时不会留下不完整的文档
+    """
+    # 多保留一个字符，用于判断文档是否超出预览长度
+    head = []
+    remaining = DOC_PREVIEW_CHARS + 1
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'x', encoding='utf-8', buffering=DOC_WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                if remaining > 0:
+                    head.append(chunk[:remaining])
+                    remaining -= len(head[-1])
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    preview = "".join(head)
+    return preview[:DOC_PREVIEW_CHARS] + "..." if len(preview) > DOC_PREVIEW_CHARS else preview
+
 # 创建MCP服务器
 server = Server("dm-mcp")
 
+# 各工具共用的参数定义（多个 Tool 共享同一对象，不要修改）。
+# 不使用 MappingProxyType 冻结：pydantic 会原样保留嵌套的映射对象，序列化工具列表时无法处理
+_SCHEMA_PROPERTY = {
+    "type": "string",
+    "description": "数据库模式名称",
+    "default": "SYSDBA"
+}
+_TABLE_NAME_PROPERTY = {
+    "type": "string",
+    "description": "表名"
+}
+_DOC_FORMAT_PROPERTY = {
+    "type": "string",
+    "description": "文档格式: markdown, json, sql",
+    "enum": list(TABLE_DOC_FORMATS),
+    "default": "markdown"
+}
+_NO_ARGS_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+_SCHEMA_ONLY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "schema": _SCHEMA_PROPERTY
+    },
+    "required": []
+}
+
+# 工具列表在模块加载时构建一次，list_tools 请求直接返回（不要修改其中的 Tool 对象）
+_TOOLS: list[Tool] = [
+    Tool(
+        name="test_connection",
+        description="测试达梦数据库连接",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="get_security_info",
+        description="获取当前安全配置信息",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="list_tables",
+        description="获取数据库中所有表的列表",
+        inputSchema=_SCHEMA_ONLY_SCHEMA
+    ),
+    Tool(
+        name="describe_table",
+        description="获取指定表的详细结构信息",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": _TABLE_NAME_PROPERTY,
+                "schema": _SCHEMA_PROPERTY
+            },
+            "required": ["table_name"]
+        }
+    ),
+    Tool(
+        name="generate_table_doc",
+        description="生成表结构设计文档并保存为文件（支持Markdown、JSON、SQL格式）",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": _TABLE_NAME_PROPERTY,
+                "schema": _SCHEMA_PROPERTY,
+                "format": _DOC_FORMAT_PROPERTY
+            },
+            "required": ["table_name"]
+        }
+    ),
+    Tool(
+        name="generate_database_overview",
+        description="生成数据库概览文档并保存为Markdown文件",
+        inputSchema=_SCHEMA_ONLY_SCHEMA
+    ),
+    Tool(
+        name="execute_query",
+        description="执行SQL语句（根据安全模式限制操作类型）",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL语句"
+                }
+            },
+            "required": ["sql"]
+        }
+    ),
+    Tool(
+        name="execute_batch",
+        description="使用多组参数批量执行同一条写入语句（在一个事务中提交，任一组失败时整批回滚；根据安全模式限制操作类型）",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "带 ? 参数占位符的 INSERT/UPDATE 等写入语句"
+                },
+                "params": {
+                    "type": "array",
+                    "description": "参数列表，每个元素为一组按占位符顺序排列的参数",
+                    "items": {"type": "array"}
+                }
+            },
+            "required": ["sql", "params"]
+        }
+    ),
+    Tool(
+        name="list_schemas",
+        description="获取用户有权限访问的所有数据库模式",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="generate_relationship_doc",
+        description="生成数据库表关系图文档（支持Mermaid格式）",
+        inputSchema=_SCHEMA_ONLY_SCHEMA
+    ),
+    Tool(
+        name="batch_generate_table_docs",
+        description="批量生成多个表的文档",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "表名列表"
+                },
+                "schema": _SCHEMA_PROPERTY,
+                "format": _DOC_FORMAT_PROPERTY
+            },
+            "required": ["table_names"]
+        }
+    ),
+    Tool(
+        name="export_to_excel",
+        description="导出表结构或数据为Excel格式",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": _TABLE_NAME_PROPERTY,
+                "schema": _SCHEMA_PROPERTY,
+                "export_type": {
+                    "type": "string",
+                    "description": "导出类型: structure, data, both",
+                    "enum": ["structure", "data", "both"],
+                    "default": "structure"
+                },
+                "data_limit": {
+                    "type": "number",
+                    "description": "数据导出行数限制",
+                    "default": 1000
+                },
+                "fast_mode": {
+                    "type": "boolean",
+                    "description": "快速模式（禁用样式，提高导出速度）",
+                    "default": True
+                }
+            },
+            "required": ["table_name"]
+        }
+    ),
+    Tool(
+        name="get_cache_info",
+        description="获取查询缓存统计信息",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="clear_cache",
+        description="清空查询缓存",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="invalidate_schema_cache",
+        description="清空表结构等元数据缓存（执行DDL后使用）",
+        inputSchema=_NO_ARGS_SCHEMA
+    )
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """
     列出可用的工具
     """
-    return [
-        Tool(
-            name="test_connection",
-            description="测试达梦数据库连接",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_security_info",
-            description="获取当前安全配置信息",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_tables",
-            description="获取数据库中所有表的列表",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="describe_table",
-            description="获取指定表的详细结构信息",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="generate_table_doc",
-            description="生成表结构设计文档并保存为文件（支持Markdown、JSON、SQL格式）",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "文档格式: markdown, json, sql",
-                        "enum": ["markdown", "json", "sql"],
-                        "default": "markdown"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="generate_database_overview",
-            description="生成数据库概览文档并保存为Markdown文件",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="execute_query",
-            description="执行SQL语句（根据安全模式限制操作类型）",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sql": {
-                        "type": "string",
-                        "description": "SQL语句"
-                    }
-                },
-                "required": ["sql"]
-            }
-        ),
-        Tool(
-            name="list_schemas",
-            description="获取用户有权限访问的所有数据库模式",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="generate_relationship_doc",
-            description="生成数据库表关系图文档（支持Mermaid格式）",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="batch_generate_table_docs",
-            description="批量生成多个表的文档",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_names": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "表名列表"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "文档格式: markdown, json, sql",
-                        "enum": ["markdown", "json", "sql"],
-                        "default": "markdown"
-                    }
-                },
-                "required": ["table_names"]
-            }
-        ),
-        Tool(
-            name="export_to_excel",
-            description="导出表结构或数据为Excel格式",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "数据库模式名称",
-                        "default": "SYSDBA"
-                    },
-                    "export_type": {
-                        "type": "string",
-                        "description": "导出类型: structure, data, both",
-                        "enum": ["structure", "data", "both"],
-                        "default": "structure"
-                    },
-                    "data_limit": {
-                        "type": "number",
-                        "description": "数据导出行数限制",
-                        "default": 1000
-                    },
-                    "fast_mode": {
-                        "type": "boolean",
-                        "description": "快速模式（禁用样式，提高导出速度）",
-                        "default": True
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="get_cache_info",
-            description="获取查询缓存统计信息",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="clear_cache",
-            description="清空查询缓存",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+    return _TOOLS
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent | ImageContent | EmbeddedResource]:
@@ -305,14 +363,19 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
         
         elif name == "get_security_info":
             security_info = db.get_security_info()
-            info_text = "当前安全配置信息:\n\n"
-            info_text += f"安全模式: {security_info['security_mode']}\n"
-            info_text += f"只读模式: {'是' if security_info['readonly_mode'] else '否'}\n"
-            info_text += f"允许写入操作: {'是' if security_info['write_allowed'] else '否'}\n"
-            info_text += f"允许危险操作: {'是' if security_info['dangerous_operations_allowed'] else '否'}\n"
-            info_text += f"允许访问的模式: {', '.join(security_info['allowed_schemas'])}\n"
-            info_text += f"最大返回行数: {security_info['max_result_rows']}\n"
-            info_text += f"查询日志: {'启用' if security_info['query_log_enabled'] else '禁用'}\n"
+            pool_stats = security_info['pool_stats']
+            info_text = "".join([
+                "当前安全配置信息:\n\n",
+                f"安全模式: {security_info['security_mode']}\n",
+                f"只读模式: {'是' if security_info['readonly_mode'] else '否'}\n",
+                f"允许写入操作: {'是' if security_info['write_allowed'] else '否'}\n",
+                f"允许危险操作: {'是' if security_info['dangerous_operations_allowed'] else '否'}\n",
+                f"允许访问的模式: {', '.join(security_info['allowed_schemas'])}\n",
+                f"最大返回行数: {security_info['max_result_rows']}\n",
+                f"查询日志: {'启用' if security_info['query_log_enabled'] else '禁用'}\n",
+                f"\n连接池: 使用中 {pool_stats['in_use']} / 空闲 {pool_stats['idle']} / 上限 {pool_stats['max_size']}\n",
+                f"连接复用次数: {pool_stats['reused']}，累计新建连接: {pool_stats['created']}\n"
+            ])
             
             return [TextContent(type="text", text=info_text)]
         
@@ -326,8 +389,8 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                     text=f"在模式 '{schema}' 中没有找到任何表"
                 )]
             
-            # 达梦数据库字段名可能是大写，尝试两种格式
-            table_list = "\n".join([f"- {table.get('tablename') or table.get('TABLENAME', 'Unknown')}" for table in tables])
+            # 元数据查询结果的字段名已统一为小写
+            table_list = "\n".join([f"- {table.get('tablename') or 'Unknown'}" for table in tables])
             return [TextContent(
                 type="text",
                 text=f"模式 '{schema}' 中的表列表:\n{table_list}\n\n总计: {len(tables)} 个表"
@@ -341,10 +404,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
             schema = arguments.get("schema", "SYSDBA")
             
             # 获取表结构信息
-            structure = db.get_table_structure(table_name, schema)
-            indexes = db.get_table_indexes(table_name, schema)
-            constraints = db.get_table_constraints(table_name, schema)
-            table_comment = db.get_table_comment(table_name, schema)
+            structure, indexes, constraints, table_comment = await fetch_table_metadata(db, table_name, schema)
             
             if not structure:
                 return [TextContent(
@@ -352,45 +412,38 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                     text=f"表 '{table_name}' 在模式 '{schema}' 中不存在"
                 )]
             
-            # 格式化输出
-            result = f"表 '{table_name}' 结构信息:\n\n"
+            # 格式化输出（先收集片段，最后一次拼接）
+            parts = [f"表 '{table_name}' 结构信息:\n\n"]
             if table_comment:
-                result += f"表注释: {table_comment}\n\n"
-            result += "字段列表:\n"
+                parts.append(f"表注释: {table_comment}\n\n")
+            parts.append("字段列表:\n")
             for col in structure:
-                # 达梦数据库字段名可能是大写，尝试两种格式
-                column_name = col.get('column_name') or col.get('COLUMN_NAME', 'Unknown')
-                data_type = col.get('data_type') or col.get('DATA_TYPE', 'Unknown')
-                is_nullable = col.get('is_nullable') or col.get('IS_NULLABLE', 'YES')
-                is_primary_key = col.get('is_primary_key') or col.get('IS_PRIMARY_KEY', 'NO')
-                column_comment = col.get('column_comment') or col.get('COLUMN_COMMENT', '')
-                
-                result += f"- {column_name} ({data_type}) "
-                if is_nullable == 'NO':
-                    result += "NOT NULL "
-                if is_primary_key == 'YES':
-                    result += "[主键] "
-                if column_comment:
-                    result += f"-- {column_comment}"
-                result += "\n"
+                # 元数据查询结果的字段名已统一为小写
+                column_name = col.get('column_name') or 'Unknown'
+                data_type = col.get('data_type') or 'Unknown'
+                column_comment = col.get('column_comment') or ''
+                parts.append(
+                    f"- {column_name} ({data_type}) "
+                    f"{'NOT NULL ' if (col.get('is_nullable') or 'YES') == 'NO' else ''}"
+                    f"{'[主键] ' if (col.get('is_primary_key') or 'NO') == 'YES' else ''}"
+                    f"{f'-- {column_comment}' if column_comment else ''}\n"
+                )
             
             if indexes:
-                result += f"\n索引 ({len(indexes)} 个):\n"
+                parts.append(f"\n索引 ({len(indexes)} 个):\n")
                 for idx in indexes:
-                    # 达梦数据库字段名可能是大写，尝试两种格式
-                    indexname = idx.get('indexname') or idx.get('INDEXNAME', 'Unknown')
-                    is_unique = idx.get('is_unique') or idx.get('IS_UNIQUE', 'NO')
-                    result += f"- {indexname} {'[唯一]' if is_unique == 'YES' else ''}\n"
+                    indexname = idx.get('indexname') or 'Unknown'
+                    is_unique = idx.get('is_unique') or 'NO'
+                    parts.append(f"- {indexname} {'[唯一]' if is_unique == 'YES' else ''}\n")
             
             if constraints:
-                result += f"\n约束 ({len(constraints)} 个):\n"
+                parts.append(f"\n约束 ({len(constraints)} 个):\n")
                 for constraint in constraints:
-                    # 达梦数据库字段名可能是大写，尝试两种格式
-                    constraint_name = constraint.get('constraint_name') or constraint.get('CONSTRAINT_NAME', 'Unknown')
-                    constraint_type = constraint.get('constraint_type') or constraint.get('CONSTRAINT_TYPE', 'Unknown')
-                    result += f"- {constraint_name} ({constraint_type})\n"
+                    constraint_name = constraint.get('constraint_name') or 'Unknown'
+                    constraint_type = constraint.get('constraint_type') or 'Unknown'
+                    parts.append(f"- {constraint_name} ({constraint_type})\n")
             
-            return [TextContent(type="text", text=result)]
+            return [TextContent(type="text", text="".join(parts))]
         
         elif name == "generate_table_doc":
             if not arguments or "table_name" not in arguments:
@@ -401,11 +454,15 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 schema = arguments.get("schema", "SYSDBA")
                 format_type = arguments.get("format", "markdown")
                 
+                if format_type not in TABLE_DOC_FORMATS:
+                    return [TextContent(
+                        type="text",
+                        text=f"不支持的文档格式: {format_type}"
+                    )]
+                generate_doc, file_ext = TABLE_DOC_FORMATS[format_type]
+                
                 # 获取表信息
-                structure = db.get_table_structure(table_name, schema)
-                indexes = db.get_table_indexes(table_name, schema)
-                constraints = db.get_table_constraints(table_name, schema)
-                table_comment = db.get_table_comment(table_name, schema)
+                structure, indexes, constraints, table_comment = await fetch_table_metadata(db, table_name, schema)
                 
                 if not structure:
                     return [TextContent(
@@ -418,61 +475,48 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 indexes = normalize_data(indexes)
                 constraints = normalize_data(constraints)
                 
-                # 生成文档
-                if format_type == "markdown":
-                    doc = doc_generator.generate_table_structure_doc(table_name, structure, indexes, constraints, schema, table_comment)
-                    file_ext = ".md"
-                elif format_type == "json":
-                    doc = doc_generator.generate_json_structure(table_name, structure, indexes, constraints, schema, table_comment)
-                    file_ext = ".json"
-                elif format_type == "sql":
-                    doc = doc_generator.generate_sql_create_statement(table_name, structure, table_comment)
-                    file_ext = ".sql"
-                else:
-                    return [TextContent(
-                        type="text",
-                        text=f"不支持的文档格式: {format_type}"
-                    )]
+                # 生成文档（边生成边写入文件）
+                doc_chunks = generate_doc(table_name, structure, indexes, constraints, schema, table_comment)
                 
                 # 确保在MCP服务目录下创建docs目录
-                service_dir = os.path.dirname(os.path.abspath(__file__))  # 获取MCP服务所在目录
-                docs_dir = os.path.join(service_dir, "docs")
-                os.makedirs(docs_dir, exist_ok=True)
+                docs_dir = _docs_dir()
                 
                 # 生成文件名
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                now = datetime.now()
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{schema}_{table_name}_{timestamp}{file_ext}"
                 file_path = os.path.join(docs_dir, filename)
                 
                 # 保存文档到文件
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(doc)
+                    preview = await asyncio.to_thread(_write_doc, file_path, doc_chunks)
                     
                     # 返回成功信息和文档预览
                     # 显示MCP服务目录的相对路径
-                    relative_path = os.path.relpath(file_path, service_dir)
-                    result_text = f"✅ 文档生成成功!\n\n"
-                    result_text += f"📁 保存路径: {relative_path}\n"
-                    result_text += f"📂 MCP服务目录: {service_dir}\n"
-                    result_text += f"📊 表名: {schema}.{table_name}\n"
-                    result_text += f"📝 格式: {format_type}\n"
-                    result_text += f"⏰ 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    result_text += "📄 文档内容预览:\n"
-                    result_text += "=" * 50 + "\n"
-                    
-                    # 限制预览长度
-                    preview = doc[:1000] + "..." if len(doc) > 1000 else doc
-                    result_text += preview
+                    relative_path = os.path.relpath(file_path, SERVICE_DIR)
+                    result_text = "".join([
+                        "✅ 文档生成成功!\n\n",
+                        f"📁 保存路径: {relative_path}\n",
+                        f"📂 MCP服务目录: {SERVICE_DIR}\n",
+                        f"📊 表名: {schema}.{table_name}\n",
+                        f"📝 格式: {format_type}\n",
+                        f"⏰ 生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                        "📄 文档内容预览:\n",
+                        "=" * 50 + "\n",
+                        preview
+                    ])
                     
                     return [TextContent(type="text", text=result_text)]
                     
-                except Exception as file_error:
-                    # 如果文件保存失败，仍然返回文档内容
-                    error_msg = f"⚠️ 文件保存失败: {str(file_error)}\n\n"
-                    error_msg += "📄 生成的文档内容:\n"
-                    error_msg += "=" * 50 + "\n"
-                    error_msg += doc
+                except OSError as file_error:
+                    # 文件保存失败时重新生成完整文档直接返回（文档生成本身出错时由外层统一报错，不再重试）
+                    doc = "".join(generate_doc(table_name, structure, indexes, constraints, schema, table_comment))
+                    error_msg = "".join([
+                        f"⚠️ 文件保存失败: {str(file_error)}\n\n",
+                        "📄 生成的文档内容:\n",
+                        "=" * 50 + "\n",
+                        doc
+                    ])
                     return [TextContent(type="text", text=error_msg)]
             
             except Exception as e:
@@ -493,44 +537,43 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 doc = doc_generator.generate_database_overview_doc(tables, schema)
                 
                 # 确保在MCP服务目录下创建docs目录
-                service_dir = os.path.dirname(os.path.abspath(__file__))  # 获取MCP服务所在目录
-                docs_dir = os.path.join(service_dir, "docs")
-                os.makedirs(docs_dir, exist_ok=True)
+                docs_dir = _docs_dir()
                 
                 # 生成文件名
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                now = datetime.now()
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{schema}_数据库概览_{timestamp}.md"
                 file_path = os.path.join(docs_dir, filename)
                 
                 # 保存文档到文件
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(doc)
+                    preview = await asyncio.to_thread(_write_doc, file_path, (doc,))
                     
                     # 返回成功信息和文档预览
                     # 显示MCP服务目录的相对路径
-                    relative_path = os.path.relpath(file_path, service_dir)
-                    result_text = f"✅ 数据库概览文档生成成功!\n\n"
-                    result_text += f"📁 保存路径: {relative_path}\n"
-                    result_text += f"📂 MCP服务目录: {service_dir}\n"
-                    result_text += f"🗂️ 模式: {schema}\n"
-                    result_text += f"📋 表数量: {len(tables)} 个\n"
-                    result_text += f"⏰ 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    result_text += "📄 文档内容预览:\n"
-                    result_text += "=" * 50 + "\n"
-                    
-                    # 限制预览长度
-                    preview = doc[:1000] + "..." if len(doc) > 1000 else doc
-                    result_text += preview
+                    relative_path = os.path.relpath(file_path, SERVICE_DIR)
+                    result_text = "".join([
+                        "✅ 数据库概览文档生成成功!\n\n",
+                        f"📁 保存路径: {relative_path}\n",
+                        f"📂 MCP服务目录: {SERVICE_DIR}\n",
+                        f"🗂️ 模式: {schema}\n",
+                        f"📋 表数量: {len(tables)} 个\n",
+                        f"⏰ 生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                        "📄 文档内容预览:\n",
+                        "=" * 50 + "\n",
+                        preview
+                    ])
                     
                     return [TextContent(type="text", text=result_text)]
                     
                 except Exception as file_error:
                     # 如果文件保存失败，仍然返回文档内容
-                    error_msg = f"⚠️ 文件保存失败: {str(file_error)}\n\n"
-                    error_msg += "📄 生成的文档内容:\n"
-                    error_msg += "=" * 50 + "\n"
-                    error_msg += doc
+                    error_msg = "".join([
+                        f"⚠️ 文件保存失败: {str(file_error)}\n\n",
+                        "📄 生成的文档内容:\n",
+                        "=" * 50 + "\n",
+                        doc
+                    ])
                     return [TextContent(type="text", text=error_msg)]
                     
             except Exception as e:
@@ -544,9 +587,11 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 return create_error_response("缺少必需的参数 'sql'", "参数错误")
             
             sql = arguments["sql"]
+            is_query = is_query_sql(sql)
             
             try:
-                results = db.execute_query(sql)
+                # 查询只展示前 QUERY_PREVIEW_ROWS 条，多取一条用于判断是否还有更多记录
+                results = db.execute_query(sql, max_rows=QUERY_PREVIEW_ROWS + 1 if is_query else None)
                 
                 if not results:
                     return [TextContent(
@@ -555,19 +600,19 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                     )]
                 
                 # 格式化结果
-                if sql.upper().strip().startswith(('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'EXPLAIN')):
-                    result_text = f"查询结果 ({len(results)} 条记录):\n\n"
-                    
-                    if len(results) <= 100:  # 限制显示条数
-                        result_text += json.dumps(results, ensure_ascii=False, indent=2)
+                if is_query:
+                    if len(results) <= QUERY_PREVIEW_ROWS:  # 限制显示条数
+                        result_text = f"查询结果 ({len(results)} 条记录):\n\n" + dumps_json(results)
                     else:
-                        result_text += f"结果集过大，仅显示前100条:\n"
-                        result_text += json.dumps(results[:100], ensure_ascii=False, indent=2)
-                        result_text += f"\n\n... (还有 {len(results) - 100} 条记录)"
+                        result_text = "".join([
+                            f"查询结果 (超过 {QUERY_PREVIEW_ROWS} 条记录):\n\n",
+                            f"结果集过大，仅显示前{QUERY_PREVIEW_ROWS}条:\n",
+                            dumps_json(results[:QUERY_PREVIEW_ROWS]),
+                            "\n\n... (还有更多记录未显示，请添加过滤条件缩小结果范围)"
+                        ])
                 else:
                     # 非查询操作的结果
-                    result_text = f"操作执行成功:\n\n"
-                    result_text += json.dumps(results, ensure_ascii=False, indent=2)
+                    result_text = "操作执行成功:\n\n" + dumps_json(results)
                 
                 return [TextContent(type="text", text=result_text)]
                 
@@ -577,6 +622,26 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                     text=f"SQL执行失败: {str(e)}"
                 )]
         
+        elif name == "execute_batch":
+            if not arguments or "sql" not in arguments or "params" not in arguments:
+                return create_error_response("缺少必需的参数 'sql' 或 'params'", "参数错误")
+            
+            params = arguments["params"]
+            if not isinstance(params, list) or not all(isinstance(row, list) for row in params):
+                return create_error_response("参数 'params' 必须是二维数组，每个元素为一组参数", "参数错误")
+            
+            try:
+                affected_rows = db.execute_many(arguments["sql"], [tuple(row) for row in params])
+                return [TextContent(
+                    type="text",
+                    text=f"批量操作执行成功: 共 {len(params)} 组参数，影响 {affected_rows} 行"
+                )]
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"SQL执行失败: {str(e)}"
+                )]
+        
         elif name == "list_schemas":
             try:
                 schemas = db.get_available_schemas()
@@ -587,8 +652,8 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                         text="没有找到可访问的数据库模式"
                     )]
                 
-                # 达梦数据库字段名可能是大写，尝试两种格式
-                schema_list = "\n".join([f"- {schema.get('schemaname') or schema.get('SCHEMANAME', 'Unknown')}" for schema in schemas])
+                # 元数据查询结果的字段名已统一为小写
+                schema_list = "\n".join([f"- {schema.get('schemaname') or 'Unknown'}" for schema in schemas])
                 
                 config_info = f"当前schema访问策略: {db._get_allowed_schemas_display()}\n\n"
                 result_text = config_info + f"可访问的数据库模式:\n{schema_list}\n\n总计: {len(schemas)} 个模式"
@@ -617,39 +682,39 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 doc = doc_generator.generate_relationship_doc(tables, relationships, schema)
                 
                 # 保存文档
-                service_dir = os.path.dirname(os.path.abspath(__file__))
-                docs_dir = os.path.join(service_dir, "docs")
-                os.makedirs(docs_dir, exist_ok=True)
+                docs_dir = _docs_dir()
                 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                now = datetime.now()
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{schema}_表关系图_{timestamp}.md"
                 file_path = os.path.join(docs_dir, filename)
                 
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(doc)
-                    
-                    relative_path = os.path.relpath(file_path, service_dir)
-                    result_text = f"✅ 表关系图文档生成成功!\n\n"
-                    result_text += f"📁 保存路径: {relative_path}\n"
-                    result_text += f"📂 MCP服务目录: {service_dir}\n"
-                    result_text += f"🗂️ 模式: {schema}\n"
-                    result_text += f"📋 表数量: {len(tables)} 个\n"
-                    result_text += f"🔗 关系数量: {len(relationships)} 个\n"
-                    result_text += f"⏰ 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    result_text += "📄 文档内容预览:\n"
-                    result_text += "=" * 50 + "\n"
+                    preview = await asyncio.to_thread(_write_doc, file_path, (doc,))
                     
-                    preview = doc[:1000] + "..." if len(doc) > 1000 else doc
-                    result_text += preview
+                    relative_path = os.path.relpath(file_path, SERVICE_DIR)
+                    result_text = "".join([
+                        "✅ 表关系图文档生成成功!\n\n",
+                        f"📁 保存路径: {relative_path}\n",
+                        f"📂 MCP服务目录: {SERVICE_DIR}\n",
+                        f"🗂️ 模式: {schema}\n",
+                        f"📋 表数量: {len(tables)} 个\n",
+                        f"🔗 关系数量: {len(relationships)} 个\n",
+                        f"⏰ 生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                        "📄 文档内容预览:\n",
+                        "=" * 50 + "\n",
+                        preview
+                    ])
                     
                     return [TextContent(type="text", text=result_text)]
                     
                 except Exception as file_error:
-                    error_msg = f"⚠️ 文件保存失败: {str(file_error)}\n\n"
-                    error_msg += "📄 生成的文档内容:\n"
-                    error_msg += "=" * 50 + "\n"
-                    error_msg += doc
+                    error_msg = "".join([
+                        f"⚠️ 文件保存失败: {str(file_error)}\n\n",
+                        "📄 生成的文档内容:\n",
+                        "=" * 50 + "\n",
+                        doc
+                    ])
                     return [TextContent(type="text", text=error_msg)]
                     
             except Exception as e:
@@ -672,17 +737,27 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 
                 # 批量生成文档
                 results = []
-                service_dir = os.path.dirname(os.path.abspath(__file__))
-                docs_dir = os.path.join(service_dir, "docs")
-                os.makedirs(docs_dir, exist_ok=True)
+                docs_dir = _docs_dir()
+                
+                # 按模式一次性获取所有表的元数据，避免逐表多次查询
+                all_structures = db.get_all_structures(schema)
+                all_indexes = db.get_all_indexes(schema)
+                all_constraints = db.get_all_constraints(schema)
+                all_comments = db.get_all_table_comments(schema)
+                
+                doc_format = TABLE_DOC_FORMATS.get(format_type)
+                
+                # 本批文档使用同一生成时间
+                now = datetime.now()
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 
                 for table_name in table_names:
                     try:
                         # 获取表信息
-                        structure = db.get_table_structure(table_name, schema)
-                        indexes = db.get_table_indexes(table_name, schema)
-                        constraints = db.get_table_constraints(table_name, schema)
-                        table_comment = db.get_table_comment(table_name, schema)
+                        structure = all_structures.get(table_name, [])
+                        indexes = all_indexes.get(table_name, [])
+                        constraints = all_constraints.get(table_name, [])
+                        table_comment = all_comments.get(table_name, "")
                         
                         if not structure:
                             results.append(f"❌ 表 '{table_name}' 不存在")
@@ -694,26 +769,17 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                         constraints = normalize_data(constraints)
                         
                         # 生成文档
-                        if format_type == "markdown":
-                            doc = doc_generator.generate_table_structure_doc(table_name, structure, indexes, constraints, schema, table_comment)
-                            file_ext = ".md"
-                        elif format_type == "json":
-                            doc = doc_generator.generate_json_structure(table_name, structure, indexes, constraints, schema, table_comment)
-                            file_ext = ".json"
-                        elif format_type == "sql":
-                            doc = doc_generator.generate_sql_create_statement(table_name, structure, table_comment)
-                            file_ext = ".sql"
-                        else:
+                        if doc_format is None:
                             results.append(f"❌ 表 '{table_name}': 不支持的格式 {format_type}")
                             continue
+                        generate_doc, file_ext = doc_format
+                        doc_chunks = generate_doc(table_name, structure, indexes, constraints, schema, table_comment)
                         
                         # 保存文档
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         filename = f"{schema}_{table_name}_{timestamp}{file_ext}"
                         file_path = os.path.join(docs_dir, filename)
                         
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(doc)
+                        await asyncio.to_thread(_write_doc, file_path, doc_chunks)
                         
                         results.append(f"✅ 表 '{table_name}': 文档已生成")
                         
@@ -721,15 +787,17 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                         results.append(f"❌ 表 '{table_name}': {str(table_error)}")
                 
                 # 返回批量处理结果
-                result_text = f"✅ 批量文档生成完成!\n\n"
-                result_text += f"📂 保存目录: docs/\n"
-                result_text += f"🗂️ 模式: {schema}\n"
-                result_text += f"📝 格式: {format_type}\n"
-                result_text += f"📋 处理表数: {len(table_names)} 个\n"
-                result_text += f"⏰ 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                result_text += "📊 处理结果:\n"
-                result_text += "=" * 50 + "\n"
-                result_text += "\n".join(results)
+                result_text = "".join([
+                    "✅ 批量文档生成完成!\n\n",
+                    "📂 保存目录: docs/\n",
+                    f"🗂️ 模式: {schema}\n",
+                    f"📝 格式: {format_type}\n",
+                    f"📋 处理表数: {len(table_names)} 个\n",
+                    f"⏰ 生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                    "📊 处理结果:\n",
+                    "=" * 50 + "\n",
+                    "\n".join(results)
+                ])
                 
                 return [TextContent(type="text", text=result_text)]
                 
@@ -760,16 +828,16 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                         text="❌ 导出Excel功能需要安装openpyxl库\n请运行: pip install openpyxl"
                     )]
                 
+                # 文件名和表内生成时间使用同一时刻
+                now = datetime.now()
+                
                 # 创建Excel工作簿（优化：禁用自动计算）
                 wb = openpyxl.Workbook()
                 wb.calculation.calcMode = 'manual'  # 禁用自动计算
                 
                 if export_type in ["structure", "both"]:
                     # 导出表结构
-                    structure = db.get_table_structure(table_name, schema)
-                    indexes = db.get_table_indexes(table_name, schema)
-                    constraints = db.get_table_constraints(table_name, schema)
-                    table_comment = db.get_table_comment(table_name, schema)
+                    structure, indexes, constraints, table_comment = await fetch_table_metadata(db, table_name, schema)
                     
                     if not structure:
                         return [TextContent(
@@ -787,7 +855,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                         ws_structure['A1'].font = Font(bold=True, size=14)
                     ws_structure['A2'] = f"模式: {schema}"
                     ws_structure['A3'] = f"表注释: {table_comment or '无'}"
-                    ws_structure['A4'] = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                    ws_structure['A4'] = f"生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}"
                     
                     # 字段信息（优化：批量写入，减少样式设置）
                     headers = ['序号', '字段名', '数据类型', '长度', '精度', '标度', '可空', '默认值', '主键', '注释']
@@ -828,7 +896,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                             ws_data['A1'].font = Font(bold=True, size=14)
                         ws_data['A2'] = f"模式: {schema}"
                         ws_data['A3'] = f"数据行数: {len(data_results)} (限制: {data_limit})"
-                        ws_data['A4'] = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        ws_data['A4'] = f"生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}"
                         
                         # 写入数据（优化：批量写入，减少样式设置）
                         if data_results:
@@ -843,27 +911,27 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                                     ws_data.cell(row=row_idx, column=col_idx, value=str(value) if value is not None else '')
                 
                 # 保存Excel文件
-                service_dir = os.path.dirname(os.path.abspath(__file__))
-                docs_dir = os.path.join(service_dir, "docs")
-                os.makedirs(docs_dir, exist_ok=True)
+                docs_dir = _docs_dir()
                 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"{schema}_{table_name}_导出_{timestamp}.xlsx"
                 file_path = os.path.join(docs_dir, filename)
                 
-                wb.save(file_path)
+                await asyncio.to_thread(wb.save, file_path)
                 
-                relative_path = os.path.relpath(file_path, service_dir)
-                result_text = f"✅ Excel导出成功!\n\n"
-                result_text += f"📁 保存路径: {relative_path}\n"
-                result_text += f"📂 MCP服务目录: {service_dir}\n"
-                result_text += f"📊 表名: {schema}.{table_name}\n"
-                result_text += f"📝 导出类型: {export_type}\n"
+                relative_path = os.path.relpath(file_path, SERVICE_DIR)
+                parts = [
+                    "✅ Excel导出成功!\n\n",
+                    f"📁 保存路径: {relative_path}\n",
+                    f"📂 MCP服务目录: {SERVICE_DIR}\n",
+                    f"📊 表名: {schema}.{table_name}\n",
+                    f"📝 导出类型: {export_type}\n"
+                ]
                 if export_type in ["data", "both"]:
-                    result_text += f"📋 数据行数: {len(data_results) if 'data_results' in locals() else 0}\n"
-                result_text += f"⏰ 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    parts.append(f"📋 数据行数: {len(data_results) if 'data_results' in locals() else 0}\n")
+                parts.append(f"⏰ 生成时间: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 
-                return [TextContent(type="text", text=result_text)]
+                return [TextContent(type="text", text="".join(parts))]
                 
             except Exception as e:
                 return [TextContent(
@@ -875,19 +943,21 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
             try:
                 cache_info = db.get_cache_info()
                 
-                result_text = "📊 查询缓存统计信息:\n\n"
-                result_text += f"缓存大小: {cache_info['cache_size']} / {cache_info['max_size']} 条\n"
-                result_text += f"缓存TTL: {cache_info['ttl']} 秒\n"
-                result_text += f"缓存条目数: {len(cache_info['entries'])} 个\n\n"
+                parts = [
+                    "📊 查询缓存统计信息:\n\n",
+                    f"缓存大小: {cache_info['cache_size']} / {cache_info['max_size']} 条\n",
+                    f"缓存TTL: {cache_info['ttl']} 秒\n",
+                    f"缓存条目数: {len(cache_info['entries'])} 个\n\n"
+                ]
                 
                 if cache_info['entries']:
-                    result_text += "📋 缓存条目:\n"
-                    for i, entry in enumerate(cache_info['entries'][:10], 1):  # 只显示前10个
-                        result_text += f"{i}. {entry[:20]}...\n"
+                    parts.append("📋 缓存条目:\n")
+                    # 只显示前10个
+                    parts.extend(f"{i}. {entry[:20]}...\n" for i, entry in enumerate(cache_info['entries'][:10], 1))
                     if len(cache_info['entries']) > 10:
-                        result_text += f"... 还有 {len(cache_info['entries']) - 10} 个条目\n"
+                        parts.append(f"... 还有 {len(cache_info['entries']) - 10} 个条目\n")
                 
-                return [TextContent(type="text", text=result_text)]
+                return [TextContent(type="text", text="".join(parts))]
                 
             except Exception as e:
                 return [TextContent(
@@ -909,6 +979,20 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                     text=f"清空缓存失败: {str(e)}"
                 )]
         
+        elif name == "invalidate_schema_cache":
+            try:
+                db.invalidate_schema_cache()
+                return [TextContent(
+                    type="text",
+                    text="✅ 元数据缓存已清空"
+                )]
+                
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"清空元数据缓存失败: {str(e)}"
+                )]
+        
         else:
             return create_error_response(f"未知的工具: {name}", "工具错误")
     
@@ -923,17 +1007,19 @@ async def main():
     try:
         # 获取配置信息
         config = get_config_instance()
-        logger.info(f"配置加载成功，安全模式: {config.security_mode.value}")
+        logger.info("配置加载成功，安全模式: %s", config.security_mode.value)
         
         # 获取数据库实例并测试连接
         db = get_db_instance()
         if db.test_connection():
             logger.info("达梦数据库连接测试成功")
+            # 预先建立连接，首批工具调用无需等待握手
+            db.pool.warm_up()
         else:
             logger.warning("达梦数据库连接测试失败，服务仍将启动")
             
     except Exception as e:
-        logger.error(f"服务初始化失败: {e}")
+        logger.error("服务初始化失败: %s", e)
         logger.error("请检查Cursor MCP配置中的环境变量设置")
         sys.exit(1)
     
@@ -953,4 +1039,8 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if uvloop is not None:
+        # 基于libuv的事件循环，降低stdio消息收发的单次开销
+        uvloop.run(main())
+    else:
+        asyncio.run(main())